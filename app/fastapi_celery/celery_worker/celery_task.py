@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, Any
 import contextvars
 from celery import shared_task
+from celery.signals import before_task_publish, task_prerun, task_postrun, worker_process_shutdown
 from celery.exceptions import Retry, MaxRetriesExceededError
 from pydantic import BaseModel
 from dataclasses import asdict
@@ -39,7 +40,7 @@ from models.class_models import (
     WorkflowStep,
 )
 from models.tracking_models import ServiceLog, LogType, TrackingModel
-from utils import log_helper
+from utils import log_helper, trace_context
 import config_loader
 
 
@@ -56,6 +57,39 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 types_list = json.loads(config_loader.get_config_value("support_types", "types"))
 
 
+# === Trace context propagation ===
+@before_task_publish.connect
+def inject_trace_id(headers: dict | None = None, **kwargs) -> None:
+    """Carry the current trace id (or the new task id) in the published task headers."""
+    if headers is not None:
+        headers.setdefault(
+            trace_context.TRACE_ID_HEADER,
+            trace_context.get_trace_id() or headers.get("id"),
+        )
+
+
+@task_prerun.connect
+def bind_trace_id(task_id: str | None = None, task=None, **kwargs) -> None:
+    """Bind the task's trace id so workflow steps can share per-trace cached objects."""
+    trace_id = task.request.get(trace_context.TRACE_ID_HEADER) if task else None
+    trace_context.bind_trace_id(trace_id or task_id)
+
+
+@task_postrun.connect
+def release_trace_id(task_id: str | None = None, **kwargs) -> None:
+    """Drop the per-trace cache once the task has finished."""
+    trace_id = trace_context.get_trace_id()
+    if trace_id:
+        trace_context.clear_trace(trace_id)
+    trace_context.bind_trace_id(None)
+
+
+@worker_process_shutdown.connect
+def flush_logs(**kwargs) -> None:
+    """Drain queued log records before a prefork child exits via os._exit (skipping atexit)."""
+    log_helper.stop_queue_listener()
+
+
 @shared_task(bind=True, retry_kwargs={"max_retries": 3})
 def task_execute(self, data: dict) -> str:
     """
@@ -158,7 +192,7 @@ async def handle_task(tracking_model: TrackingModel) -> Dict[str, Any]:
         extra={
             "service": ServiceLog.FILE_EXTRACTION,
             "log_type": LogType.TASK,
-            "data": file_processor.file_record,
+            "data": asdict(file_processor.file_record),
         },
     )
     tracking_model.document_type = DocumentType(file_processor.document_type).name
@@ -171,8 +205,8 @@ async def handle_task(tracking_model: TrackingModel) -> Dict[str, Any]:
         tracking_model=tracking_model,
     )
 
-    file_processor.file_record["folder_name"] = workflow_model.folderName
-    file_processor.file_record["customer_foldername"] = workflow_model.customerFolderName
+    file_processor.file_record.folder_name = workflow_model.folderName
+    file_processor.file_record.customer_foldername = workflow_model.customerFolderName
 
     logger.info(
         f"[{tracking_model.request_id}] Workflow detail:\n",
@@ -349,9 +383,9 @@ async def get_workflow_filter(
 ):
     logger.info(f"[{tracking_model.request_id}] Start workflow filter")
     body_data = asdict(WorkflowFilterBody(
-        filePath=file_processor.file_record["file_path_parent"],
-        fileName=file_processor.file_record["file_name"],
-        fileExtension=file_processor.file_record["file_extension"],
+        filePath=file_processor.file_record.file_path_parent,
+        fileName=file_processor.file_record.file_name,
+        fileExtension=file_processor.file_record.file_extension,
         project=tracking_model.project_name,
         source=tracking_model.source_name,
     ))
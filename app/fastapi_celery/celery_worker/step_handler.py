@@ -68,20 +68,32 @@ def raise_if_failed(result: BaseModel, step_name: str) -> None:
     )
 
 
+def _get_from_model(ctx: BaseModel, key: str) -> Any:
+    return getattr(ctx, key, None)
+
+
+def _get_from_dict(ctx: dict, key: str) -> Any:
+    return ctx.get(key)
+
+
+def _getter_for(ctx: BaseModel | dict) -> Callable[[Any, str], Any]:
+    """Pick the context accessor once, so callers resolving many keys skip the type check."""
+    return _get_from_model if isinstance(ctx, BaseModel) else _get_from_dict
+
+
 def get_value(ctx: BaseModel | dict, key: str) -> Any:
         """Safely access values ​​in context (dict or BaseModel)."""
-        if isinstance(ctx, BaseModel):
-            return getattr(ctx, key, None)
-        return ctx.get(key)
+        return _getter_for(ctx)(ctx, key)
 
 
 def resolve_args(step_config: StepDefinition, context: BaseModel | dict, step_name: str) -> tuple[list[Any], dict[str, Any]]:
     args: list[Any] = []
     kwargs: dict[str, Any] = {}
+    getter = _getter_for(context)
 
     # === Positional args
     if hasattr(step_config, "args") and step_config.args:
-        args = [get_value(context, arg) for arg in step_config.args]
+        args = [getter(context, arg) for arg in step_config.args]
         logger.info(f"[resolve_args] using args for {step_name}: {step_config.args}")
         if len(args) == 1:
             # If there is only 1 arg then write "input_data"
@@ -96,7 +108,7 @@ def resolve_args(step_config: StepDefinition, context: BaseModel | dict, step_na
                 context["input_data"] = args
 
     elif hasattr(step_config, "data_input") and step_config.data_input:
-        value = get_value(context, step_config.data_input)
+        value = getter(context, step_config.data_input)
         args = [value]
         logger.info(f"[resolve_args] using args for {step_name}: {step_config.data_input}")
 
@@ -104,7 +116,7 @@ def resolve_args(step_config: StepDefinition, context: BaseModel | dict, step_na
     if hasattr(step_config, "kwargs") and step_config.kwargs:
         kwargs = {
             arg_name: (
-                get_value(context, arg_key) if isinstance(arg_key, str) else arg_key
+                getter(context, arg_key) if isinstance(arg_key, str) else arg_key
             )
             for arg_name, arg_key in step_config.kwargs.items()
         }
@@ -209,9 +221,9 @@ async def execute_step(file_processor: ProcessorBase, context_data: ContextData,
     ) or file_processor.workflow_step_ids.get("TEMPLATE_FILE_PARSE")
 
     config_api_ctx = {
-        "file_name": file_processor.file_record["file_name"],
-        "file_name_without_ext": str(file_processor.file_record["file_name"]).removesuffix(
-            file_processor.file_record["file_extension"]
+        "file_name": file_processor.file_record.file_name,
+        "file_name_without_ext": str(file_processor.file_record.file_name).removesuffix(
+            file_processor.file_record.file_extension
         ),
         "workflowStepId": parser_step_id,
         "templateFileParseId": None,
@@ -437,7 +449,7 @@ def build_s3_key_prefix(
     step_order = f"{int(step.stepOrder):02}"
 
     if is_master_data:
-        file_name = file_processor.file_record.get("file_name")
+        file_name = file_processor.file_record.file_name
         prefix_part, _ = os.path.splitext(file_name or "")
         logger.info("prefix_part: %s", prefix_part)
     else:
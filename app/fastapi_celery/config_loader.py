@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from dotenv import load_dotenv
@@ -11,9 +12,11 @@ config = ConfigParser()
 config.read(Path(__file__).resolve().parent / "configs.ini")
 
 
+@lru_cache(maxsize=256)
 def get_config_value(section: str, key: str, fallback: Optional[Any] = None) -> Any:
     """
-    Retrieve a value from the configs.ini file.
+    Retrieve a value from the configs.ini file. Results are cached since the file is
+    only read once at import time.
 
     Args:
         section (str): The section in the INI file to look under.
@@ -2,11 +2,14 @@
 from utils import log_helper
 import logging
 import json
+import threading
 from typing import Optional
 
 # Third-Party Imports
 import traceback
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import config_loader
 from models.tracking_models import ServiceLog, LogType
@@ -24,6 +27,45 @@ base_logger = logging.getLogger(logger_name)
 logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 
 
+# Shared S3 client settings: keep-alive connections, enough pool for worker threads
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Managed copies: objects above 64 MiB are copied as parallel UploadPartCopy parts
+S3_COPY_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+
+_s3_clients: dict = {}
+_s3_clients_lock = threading.Lock()
+
+
+def get_shared_s3_client(region_name: str | None = None):
+    """Return the process-wide S3 client for a region, creating it once under a lock.
+
+    boto3 low-level clients are thread-safe, so one client (and its connection pool)
+    serves every bucket and thread in the process.
+    """
+    region_name = (
+        region_name or config_loader.get_env_variable("AWS_REGION", "ap-southeast-1")
+    ).strip()
+    client = _s3_clients.get(region_name)
+    if client is None:
+        with _s3_clients_lock:
+            client = _s3_clients.get(region_name)
+            if client is None:
+                client = boto3.client("s3", region_name=region_name, config=S3_CLIENT_CONFIG)
+                _s3_clients[region_name] = client
+    return client
+
+
 # === S3 Connector using boto3 ===
 class S3Connector:
     """AWS S3 Connector using boto3 for bucket operations.
@@ -46,8 +88,8 @@ class S3Connector:
             or config_loader.get_env_variable("AWS_REGION", "ap-southeast-1")
         ).strip()
 
-        # Initialize boto3 client with region and optional credentials
-        self.client = boto3.client("s3", region_name=self.region_name)
+        # Reuse the shared client for this region instead of building one per connector
+        self.client = get_shared_s3_client(self.region_name)
 
         # Check if bucket exists or try to create it
         self._ensure_bucket_exists()
@@ -1,7 +1,7 @@
 from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass
 
-@dataclass # NOSONAR
+@dataclass(slots=True) # NOSONAR
 class WorkflowFilterBody:
     filePath: str # NOSONAR
     fileName: str # NOSONAR
@@ -9,13 +9,13 @@ class WorkflowFilterBody:
     project: str # NOSONAR
     source: str # NOSONAR
 
-@dataclass # NOSONAR
+@dataclass(slots=True) # NOSONAR
 class WorkflowSessionStartBody:
     workflowId: str # NOSONAR
     celeryId: str # NOSONAR
     filePath: str # NOSONAR
 
-@dataclass # NOSONAR
+@dataclass(slots=True) # NOSONAR
 class WorkflowStepStartBody:
     sessionId: str # NOSONAR
     stepId: str # NOSONAR
@@ -1,4 +1,5 @@
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field, model_validator
@@ -191,6 +192,41 @@ class StartStep(BaseModel):
     status: str
 
 
+@dataclass(slots=True)
+class FileRecord:
+    """Metadata of the file being processed, built once by the extract_metadata step.
+
+    Attributes:
+        file_path (str): Full path (or S3 key) of the file.
+        file_path_parent (str): Parent folder of the file, ending with "/".
+        source_type (SourceType): Where the file was loaded from.
+        file_size (str): Human readable file size.
+        file_name (str): File name with extension.
+        file_name_wo_ext (str): File name without extension.
+        file_extension (str): Lower-cased file extension, including the dot.
+        document_type (DocumentType): ORDER or MASTER_DATA.
+        raw_bucket_name (str): Bucket holding the raw file.
+        target_bucket_name (str): Bucket receiving the workflow outputs.
+        proceed_at (str): UTC timestamp of the metadata extraction.
+        folder_name (str): Workflow folder name, set once the workflow is resolved.
+        customer_foldername (str): Workflow customer folder name, set once the workflow is resolved.
+    """
+
+    file_path: Optional[str] = None
+    file_path_parent: Optional[str] = None
+    source_type: Optional[SourceType] = None
+    file_size: Optional[str] = None
+    file_name: Optional[str] = None
+    file_name_wo_ext: Optional[str] = None
+    file_extension: Optional[str] = None
+    document_type: Optional[DocumentType] = None
+    raw_bucket_name: Optional[str] = None
+    target_bucket_name: Optional[str] = None
+    proceed_at: Optional[str] = None
+    folder_name: Optional[str] = None
+    customer_foldername: Optional[str] = None
+
+
 class PathEncoder(json.JSONEncoder):  # pragma: no cover  # NOSONAR
     """Custom JSON encoder for serializing Path objects.
 
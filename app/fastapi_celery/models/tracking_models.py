@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Optional
+from pydantic import BaseModel, PrivateAttr
 from enum import Enum
 
 from models.class_models import FilePathRequest
@@ -33,9 +33,40 @@ class TrackingModel(BaseModel):
     sap_masterdata: bool | None = None
     rerun_attempt: int | None = None
 
+    _log_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field update invalidates the memoized log representation
+        if name in type(self).model_fields:
+            self._log_cache = None
+        super().__setattr__(name, value)
+
+    def to_log_dict(self) -> dict[str, Any]:
+        """
+        Return a JSON-safe dict of the model for log `extra["data"]`.
+
+        The dump is memoized on the instance and reset whenever a field is
+        assigned, so repeated log calls within a step do not re-serialize.
+        """
+        if self._log_cache is None:
+            self._log_cache = self.model_dump(mode="json")
+        return self._log_cache
+
     @classmethod
     def from_data_request(cls, data: FilePathRequest) -> "TrackingModel":
-        return cls(
+        """
+        Build a TrackingModel from an already-validated FilePathRequest.
+
+        Validation is skipped via `model_construct` since every field comes
+        from a validated model; untrusted payloads must go through `model_validate`.
+        `request_id` is required here but optional on the request, so it is checked explicitly.
+
+        Raises:
+            ValueError: If the request has no `celery_id`.
+        """
+        if not data.celery_id:
+            raise ValueError("FilePathRequest.celery_id is required to build a TrackingModel")
+        return cls.model_construct(
             request_id=data.celery_id,
             file_path=data.file_path,
             project_name=data.project,
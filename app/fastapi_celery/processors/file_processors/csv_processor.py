@@ -3,6 +3,9 @@ import csv
 import io
 import chardet
 import logging
+import mmap
+import os
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from utils import file_extraction
@@ -12,6 +15,7 @@ from models.class_models import PODataParsed, SourceType, StatusEnum
 import config_loader
 
 METADATA_SEPARATOR = config_loader.get_env_variable("METADATA_SEPARATOR", "：")
+_SEPARATOR_LEN = len(METADATA_SEPARATOR)
 
 # === Logging setup ===
 logger_name = "CSV Processor"
@@ -20,6 +24,61 @@ base_logger = logging.getLogger(logger_name)
 logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 # =====================
 
+# chardet scores bytes in pure Python, so it only sees a prefix of the file first
+ENCODING_SAMPLE_BYTES = 64 * 1024
+# Below this confidence (or on an ASCII-only prefix) the whole file is scanned
+ENCODING_MIN_CONFIDENCE = 0.8
+
+
+def decode_csv_content(content) -> str:
+    """Decode CSV bytes as UTF-8 (BOM optional) when valid, else with the encoding chardet detects.
+
+    Accepts any bytes-like object (bytes, memoryview, mmap) so callers can decode
+    without first copying the file into a bytes object.
+    """
+    try:
+        return str(content, "utf-8-sig")
+    except UnicodeDecodeError:
+        pass
+    detected = chardet.detect(bytes(content[:ENCODING_SAMPLE_BYTES]))
+    if detected["encoding"] in (None, "ascii") or detected.get("confidence", 0) < ENCODING_MIN_CONFIDENCE:
+        detected = _detect_encoding_incrementally(content)
+    encoding = detected["encoding"] or "utf-8"
+    return str(content, encoding, "replace")
+
+
+def _detect_encoding_incrementally(content) -> dict:
+    """Feed the whole content to chardet chunk by chunk, stopping once it is confident."""
+    detector = chardet.UniversalDetector()
+    for start in range(0, len(content), ENCODING_SAMPLE_BYTES):
+        detector.feed(bytes(content[start:start + ENCODING_SAMPLE_BYTES]))
+        if detector.done:
+            break
+    return detector.close()
+
+
+def read_local_csv_text(file_path) -> str:
+    """Decode a local CSV straight from a read-only memory map of the file."""
+    with open(file_path, "rb") as csv_file:
+        if os.fstat(csv_file.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return decode_csv_content(content)
+
+
+@lru_cache(maxsize=1024)
+def _is_likely_header(row: Tuple[str, ...]) -> bool:
+    """Cached header check; batches of files from one template repeat the same header rows."""
+    threshold = len(row) * 0.7
+    non_numeric_count = 0
+    for cell in row:
+        if cell and not cell.replace(".", "", 1).isdigit():
+            non_numeric_count += 1
+            # Stop as soon as the row qualifies
+            if non_numeric_count >= threshold:
+                return True
+    return non_numeric_count >= threshold
+
 
 class CSVProcessor:
     """Processor for handling CSV PO template."""
@@ -42,7 +101,7 @@ class CSVProcessor:
         Returns:
             list: A list of non-empty rows from the CSV file.
         """
-        file_object = file_extraction.FileExtensionProcessor(
+        file_object = file_extraction.get_file_processor(
             tracking_model=self.tracking_model, source_type=self.source
         )
         file_object._get_file_extension()
@@ -50,20 +109,16 @@ class CSVProcessor:
         self.capacity = file_object._get_file_capacity()
 
         if file_object.source_type == "local":
-            with open(file_object.file_path, "rb") as csv_file:
-                content = csv_file.read()
+            text = read_local_csv_text(file_object.file_path)
         else:
-            file_object.object_buffer.seek(0)
-            content = file_object.object_buffer.read()
-
-        detected = chardet.detect(content)
-        encoding = detected["encoding"] or "utf-8"
-        decoded_content = io.TextIOWrapper(
-            io.BytesIO(content), encoding=encoding, errors="replace"
-        )
+            # Decode from a view of the downloaded buffer rather than a bytes copy
+            with file_object.object_buffer.getbuffer() as content:
+                text = decode_csv_content(content)
 
-        reader = csv.reader(decoded_content)
-        return [row for row in reader if any(cell.strip() for cell in row)]
+        # Let the C tokenizer split rows; a row is kept when any of its cells
+        # has non-whitespace content
+        reader = csv.reader(io.StringIO(text))
+        return [row for row in reader if "".join(row).strip()]
 
     def extract_metadata(self, row: List[str]) -> dict:
         """Extract key-value pairs from a row if it contains metadata.
@@ -75,9 +130,10 @@ class CSVProcessor:
             dict: A dictionary of key-value pairs extracted from the row.
         """
         for cell in row:
-            if METADATA_SEPARATOR in cell:
-                key, val = cell.split(METADATA_SEPARATOR, 1)
-                return {key.strip(): val.strip()}
+            # One scan per cell: locate the separator and slice around it
+            idx = cell.find(METADATA_SEPARATOR)
+            if idx >= 0:
+                return {cell[:idx].strip(): cell[idx + _SEPARATOR_LEN:].strip()}
         return {}
 
     def is_likely_header(self, row: List[str]) -> bool:
@@ -89,10 +145,7 @@ class CSVProcessor:
         Returns:
             bool: True if at least 70% of fields are non-numeric and non-empty.
         """
-        non_numeric_count = sum(
-            1 for cell in row if cell and not cell.replace(".", "", 1).isdigit()
-        )
-        return non_numeric_count >= len(row) * 0.7
+        return _is_likely_header(tuple(row))
 
     def parse_file_to_json(self) -> PODataParsed:
         """Parse the CSV content into MasterDataParsed."""
@@ -152,14 +205,16 @@ class CSVProcessor:
         self, start: int, header: List[str]
     ) -> Tuple[List[dict], int]:
         items = []
+        header = tuple(header)
+        width = len(header)
+        n_rows = len(self.rows)
         j = start
-        while j < len(self.rows):
+        while j < n_rows:
             row = [cell.strip() for cell in self.rows[j]]
             if self.extract_metadata(row):
                 break
-            if len(row) == len(header):
-                items.append(dict(zip(header, row)))
-                j += 1
-            else:
+            if len(row) != width:
                 break
+            items.append(dict(zip(header, row)))
+            j += 1
         return items, j
@@ -45,42 +45,29 @@ class ExcelProcessor(excel_helper.ExcelHelper):
         Returns:
             PODataParsed: PODataParsed object
         """
+        # Clean and classify every row once; the walk below only moves forward
+        rows = [[cell.strip() for cell in row] for row in self.rows]
+        row_metadata = [self.extract_metadata(row) for row in rows]
+
         metadata = {}
         items = []
         i = 0
+        n_rows = len(rows)
 
-        while i < len(self.rows):
-            row = [str(cell).strip() for cell in self.rows[i]]
-            key_value_pairs = self.extract_metadata(row)
-
-            if key_value_pairs:
-                metadata.update(key_value_pairs)
+        while i < n_rows:
+            if row_metadata[i]:
+                metadata.update(row_metadata[i])
                 i += 1
                 continue
 
-            # Start checking for table data
-            header_row = row
-            table_block = []
+            # Start checking for table data: following rows of the header's width
+            header_row = rows[i]
             j = i + 1
+            while j < n_rows and not row_metadata[j] and len(rows[j]) == len(header_row):
+                j += 1
 
-            while j < len(self.rows):
-                current_row = [str(cell).strip() for cell in self.rows[j]]
-                kv_pairs = self.extract_metadata(current_row)
-
-                if kv_pairs:
-                    metadata.update(kv_pairs)
-                    break
-
-                if len(current_row) == len(header_row):
-                    table_block.append(current_row)
-                    j += 1
-                else:
-                    break
-
-            if table_block:
-                headers = header_row
-                for row_data in table_block:
-                    items.append(dict(zip(headers, row_data)))
+            if j > i + 1:
+                items.extend(dict(zip(header_row, row_data)) for row_data in rows[i + 1:j])
                 i = j
             else:
                 i += 1
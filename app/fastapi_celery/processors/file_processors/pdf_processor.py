@@ -1,8 +1,8 @@
 import re
+import sys
+import importlib.util
 from pathlib import Path
 import traceback
-import pymupdf as fitz
-import pdfplumber
 from typing import List, Dict, Any, Tuple, Optional
 
 import logging
@@ -12,6 +12,28 @@ from utils import log_helper
 from models.class_models import SourceType, PODataParsed, StatusEnum
 from processors.helpers.pdf_helper import build_success_response, build_failed_response
 
+
+def _lazy_import(name: str):
+    """Import a module whose body only runs on first attribute access.
+
+    pymupdf and pdfplumber (with pdfminer) take a few hundred ms to import; workers
+    that never see a PDF should not pay for them at startup.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+fitz = _lazy_import("pymupdf")
+pdfplumber = _lazy_import("pdfplumber")
+
 # ===
 # Set up logging
 logger_name = "PDF Processor"
@@ -24,6 +46,20 @@ logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 
 LINE_ENDS_WITH_COLON_PATTERN = re.compile(r".+[：:]\s*$")
 KV_PATTERN = re.compile(r"([^：:\s]+)[：:]\s*")
+# Patterns used inside the per-line parsing loops, compiled once at import
+COLON_PATTERN = re.compile(r"[：:]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SEGMENT_SPLIT_PATTERN = re.compile(r"\t+|\s{2,}")
+SEGMENT_KV_PATTERN = re.compile(r"(.+?)[：:]\s*(.*)")
+TIME_PATTERN = re.compile(r"^(上午|下午)\d{2}:\d{2}:\d{2}$")
+NUMBERED_NOTE_PATTERN = re.compile(r"^\d+[.．]")
+PRODUCT_CODE_PATTERN = re.compile(r"^S\d{7}[A-Z]?$")
+ADDITIONAL_SPEC_PATTERN = re.compile(r".*?\d入/盒")
+BOUNDED_KV_PATTERN = re.compile(r"^([^：:]{2,20})[：:]([^\n]{0,100})$")
+VENDOR_NAME_PATTERN = re.compile(r"^\d{8}台灣大昌華嘉股份有限公司.*")
+ITEM_LINE_PATTERN = re.compile(r"^\d{6}\s+\w+")
+ITEM_BARCODE_PATTERN = re.compile(r"^\*U\d{8}-\d{4}\*$")
+LEADING_DIGIT_PATTERN = re.compile(r"^\d")
 
 
 class Pdf001Template:
@@ -45,11 +81,11 @@ class Pdf001Template:
             if not line:
                 continue
 
-            segments = re.split(r'\t+|\s{2,}', line)
+            segments = SEGMENT_SPLIT_PATTERN.split(line)
             found_kv = False
 
             for seg in segments:
-                match = re.match(r"(.+?)[：:]\s*(.*)", seg)
+                match = SEGMENT_KV_PATTERN.match(seg)
                 if match:
                     key = match.group(1).strip()
                     value = match.group(2).strip()
@@ -61,7 +97,7 @@ class Pdf001Template:
                     metadata[prev_key] = line
                     prev_key = None
                 elif LINE_ENDS_WITH_COLON_PATTERN.match(line):
-                    prev_key = re.split(r"[：:]", line)[0].strip()
+                    prev_key = COLON_PATTERN.split(line, maxsplit=1)[0].strip()
                     metadata[prev_key] = ""
 
         return metadata
@@ -107,7 +143,7 @@ class Pdf001Template:
             PODataParsed: Extracted data object.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model,
                 source_type=self.source
             )
@@ -167,8 +203,6 @@ class Pdf002Template:
         metadata = {}
         prev_key = None
 
-        time_pattern = re.compile(r"^(上午|下午)\d{2}:\d{2}:\d{2}$")
-
         collecting_notes = False
         note_key = ""
         note_lines = []
@@ -185,14 +219,14 @@ class Pdf002Template:
                 continue
 
             if collecting_notes:
-                if re.match(r"^\d+[.．]", line) or (note_lines and not KV_PATTERN.match(line)):
+                if NUMBERED_NOTE_PATTERN.match(line) or (note_lines and not KV_PATTERN.match(line)):
                     note_lines.append(line)
                     continue
                 else:
                     metadata[note_key] = "\n".join(note_lines)
                     collecting_notes = False
 
-            if time_pattern.match(line):
+            if TIME_PATTERN.match(line):
                 if prev_key:
                     metadata[prev_key] = line
                     prev_key = None
@@ -216,7 +250,7 @@ class Pdf002Template:
                 metadata[prev_key] = line
                 prev_key = None
             elif LINE_ENDS_WITH_COLON_PATTERN.match(line):
-                prev_key = re.split(r"[：:]", line)[0].strip()
+                prev_key = COLON_PATTERN.split(line, maxsplit=1)[0].strip()
                 metadata[prev_key] = ""
 
         if collecting_notes:
@@ -263,7 +297,7 @@ class Pdf002Template:
             PODataParsed: Extracted data object.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model, source_type=self.source
             )
             capacity = file_object._get_file_capacity()
@@ -337,7 +371,7 @@ class Pdf004Template:
                 metadata[prev_key] = line
                 prev_key = None
             elif LINE_ENDS_WITH_COLON_PATTERN.match(line):
-                prev_key = re.split(r"[：:]", line)[0].strip()
+                prev_key = COLON_PATTERN.split(line, maxsplit=1)[0].strip()
                 metadata[prev_key] = ""
 
         return metadata
@@ -350,17 +384,17 @@ class Pdf004Template:
             List[Tuple[str, str]]: List of (main_line, additional_spec) tuples.
         """
         items = []
-        product_code_pattern = re.compile(r"^S\d{7}[A-Z]?$")
-        additional_spec_pattern = re.compile(r".*?\d入/盒")
+        n_lines = len(all_lines)
 
         i = 0
-        while i < len(all_lines):
+        while i < n_lines:
             line = all_lines[i]
-            tokens = line.split()
-            if tokens and product_code_pattern.match(tokens[0]):
+            # Only the first token decides whether this is a product line
+            tokens = line.split(None, 1)
+            if tokens and PRODUCT_CODE_PATTERN.match(tokens[0]):
                 main_line = line
                 additional_spec = ""
-                if i + 1 < len(all_lines) and additional_spec_pattern.match(all_lines[i + 1]):
+                if i + 1 < n_lines and ADDITIONAL_SPEC_PATTERN.match(all_lines[i + 1]):
                     additional_spec = all_lines[i + 1].strip()
                     i += 2
                 else:
@@ -382,11 +416,10 @@ class Pdf004Template:
             List[Dict[str, Any]]: Table rows.
         """
         results = []
-        product_code_pattern = re.compile(r"^S\d{7}[A-Z]?$")
 
         for main_line, additional_spec in items:
-            tokens = re.split(r"\s+", main_line)
-            if len(tokens) >= 8 and product_code_pattern.match(tokens[0]):
+            tokens = WHITESPACE_PATTERN.split(main_line)
+            if len(tokens) >= 8 and PRODUCT_CODE_PATTERN.match(tokens[0]):
                 full_product_name = tokens[1] + (" " + additional_spec if additional_spec else "")
                 results.append({
                     "產品編號": tokens[0],
@@ -427,7 +460,7 @@ class Pdf004Template:
             PODataParsed: Extracted data object.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model,
                 source_type=self.source
             )
@@ -479,8 +512,7 @@ class Pdf006Template:
         self.po_number = None
 
     def _parse_kv_line(self, line: str, metadata: dict, current_key_holder: dict):
-        kv_pattern = re.compile(r"^([^：:]{2,20})[：:]([^\n]{0,100})$")
-        match = kv_pattern.match(line)
+        match = BOUNDED_KV_PATTERN.match(line)
         if match:
             key = match.group(1).strip()
             value = match.group(2).strip()
@@ -496,8 +528,7 @@ class Pdf006Template:
         return False
 
     def _extract_special_fields(self, line: str, metadata: dict):
-        long_number_pattern = re.compile(r"^\d{8}台灣大昌華嘉股份有限公司.*")
-        if long_number_pattern.match(line):
+        if VENDOR_NAME_PATTERN.match(line):
             metadata["廠商名稱"] = line
 
         if "交貨地點" in line:
@@ -560,7 +591,7 @@ class Pdf006Template:
         line2 = lines[i + 1] if i + 1 < len(lines) else ""
         item: dict[str, Any] = {}
 
-        if not re.match(r"^\d{6}\s+\w+", line1):
+        if not ITEM_LINE_PATTERN.match(line1):
             return {}, i + 1 
 
         parts1 = line1.split()
@@ -585,7 +616,7 @@ class Pdf006Template:
                 item["品名／規格／製造廠／型號"] += " " + more_desc
 
         next_i = i + 2
-        if i + 2 < len(lines) and re.match(r"^\*U\d{8}-\d{4}\*$", lines[i + 2]):
+        if i + 2 < len(lines) and ITEM_BARCODE_PATTERN.match(lines[i + 2]):
             next_i = i + 3
 
         return item, next_i
@@ -612,7 +643,7 @@ class Pdf006Template:
         Process PDF into metadata and items using dynamic parsing.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model,
                 source_type=self.source
             )
@@ -798,7 +829,7 @@ class Pdf007Template:
             PODataParsed: Extracted data object.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model, source_type=self.source
             )
             capacity = file_object._get_file_capacity()
@@ -881,7 +912,7 @@ class Pdf008Template:
     def extract_tables(self, text_lines: List[str]) -> List[Dict[str, Any]]:
         all_rows = []
         for i in range(len(text_lines)):
-            if re.match(r"^\d", text_lines[i]):
+            if LEADING_DIGIT_PATTERN.match(text_lines[i]):
                 row = text_lines[i].split()
                 if len(row) >= 4:
                     record = {
@@ -903,7 +934,7 @@ class Pdf008Template:
             PODataParsed: Extracted data object.
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(
+            file_object = file_extraction.get_file_processor(
                 tracking_model=self.tracking_model, source_type=self.source
             )
             capacity = file_object._get_file_capacity()
@@ -50,7 +50,7 @@ class TXTProcessor:
         Extracts and returns the text content of the file.
         Works for both local and S3 sources.
         """
-        file_object = file_extraction.FileExtensionProcessor(
+        file_object = file_extraction.get_file_processor(
             tracking_model=self.tracking_model, source_type=self.source
         )
         self.capacity = file_object._get_file_capacity()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List
 from pathlib import Path
 import logging
 import re
@@ -24,7 +24,7 @@ class Txt001Template(TxtHelper):
     Processor for file '0809-1.TXT' with double-space-separated columns.
     """
 
-    def parse_space_separated_lines(self, lines: List[str]) -> List[dict]:
+    def parse_space_separated_lines(self, lines: Iterable[str]) -> List[dict]:
         items = []
         for line in lines:
             values = re.split(r"\s{2,}", line.strip())
@@ -44,7 +44,7 @@ class Txt002Template(TxtHelper):
     def __init__(self, tracking_model: TrackingModel, source: SourceType = SourceType.SFTP):
         super().__init__(tracking_model, source, encoding="big5")
 
-    def parse_tab_separated_lines(self, lines: List[str]) -> List[dict]:
+    def parse_tab_separated_lines(self, lines: Iterable[str]) -> List[dict]:
         items = []
         for line in lines:
             if not line.strip():
@@ -66,7 +66,7 @@ class Txt003Template(TxtHelper):
     def __init__(self, tracking_model: TrackingModel, source: SourceType = SourceType.SFTP):
         super().__init__(tracking_model, source, encoding="big5")
 
-    def parse_space_separated_lines(self, lines: List[str]) -> List[dict]:
+    def parse_space_separated_lines(self, lines: Iterable[str]) -> List[dict]:
         items = []
         for line in lines:
             values = line.strip().split()
@@ -83,7 +83,7 @@ class Txt004Template(TxtHelper):
     Processor for TXT file '20240711-143536-w25in20240711.TXT'.
     """
 
-    def parse_tabular_data_with_headers(self, lines: List[str]) -> List[dict]:
+    def parse_tabular_data_with_headers(self, lines: Iterable[str]) -> List[dict]:
         """
         Parse lines using the header row as keys and tab-separated values as data.
         Skips non-data lines above the header.
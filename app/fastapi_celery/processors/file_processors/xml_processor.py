@@ -47,7 +47,7 @@ class XMLProcessor:
         Returns:
             str: The extracted text content of the file.
         """
-        file_object = file_extraction.FileExtensionProcessor(
+        file_object = file_extraction.get_file_processor(
             tracking_model=self.tracking_model, source_type=self.source
         )
         self.capacity = file_object._get_file_capacity()
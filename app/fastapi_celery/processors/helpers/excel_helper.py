@@ -1,8 +1,9 @@
 from io import BytesIO
 from pathlib import Path
-import pandas as pd
+import openpyxl
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import Any, List, Dict, Tuple
 
 import logging
 from utils import file_extraction
@@ -25,6 +26,64 @@ logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 # ===
 
 
+@lru_cache(maxsize=8)
+def _inner_metadata_patterns(separator: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compile, once per separator, the patterns matching a "(key<sep>value)" group in a cell."""
+    inner = rf"\(([^()]*?{re.escape(separator)}[^()]*)\)"
+    return re.compile(inner), re.compile(rf"(.*){inner}")
+
+
+# pandas' default NA strings (pandas._libs.parsers.STR_NA_VALUES), kept here so the
+# .xlsx path does not import pandas
+_NA_STRINGS = frozenset(
+    {
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+        "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+        "n/a", "nan", "null",
+    }
+)
+
+
+def _xlsx_cell_to_str(value: Any) -> str:
+    """Convert an openpyxl cell value to the string pandas.read_excel(dtype=str) would produce."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        # Whole floats are read as ints, as pandas' openpyxl reader does
+        return str(int(value)) if value.is_integer() else str(value)
+    text = str(value)
+    return "" if text in _NA_STRINGS else text
+
+
+def _read_xlsx_rows(file_input) -> List[List[str]]:
+    """
+    Stream rows from all sheets of an .xlsx workbook in openpyxl's read-only mode.
+
+    Rows keep pandas.read_excel(header=None, dtype=str) semantics: trailing empty
+    rows and cells are dropped, rows are padded to the sheet width, and values that
+    pandas treats as missing become empty strings.
+    """
+    workbook = openpyxl.load_workbook(file_input, read_only=True, data_only=True, keep_links=False)
+    try:
+        all_rows = []
+        for worksheet in workbook.worksheets:
+            # Read-only sheets trust the stored dimension, which is often wrong
+            worksheet.reset_dimensions()
+            sheet_rows = []
+            for values in worksheet.iter_rows(values_only=True):
+                row = [_xlsx_cell_to_str(value) for value in values]
+                while row and not row[-1]:
+                    row.pop()
+                sheet_rows.append(row)
+            while sheet_rows and not sheet_rows[-1]:
+                sheet_rows.pop()
+            width = max(map(len, sheet_rows), default=0)
+            all_rows.extend(row + [""] * (width - len(row)) for row in sheet_rows)
+        return all_rows
+    finally:
+        workbook.close()
+
+
 class ExcelHelper:
     """Processor for handling Excel file operations.
 
@@ -54,7 +113,7 @@ class ExcelHelper:
         Returns:
             List[List[str]]: A list of rows, where each row is a list of strings.
         """
-        file_object = file_extraction.FileExtensionProcessor(
+        file_object = file_extraction.get_file_processor(
             tracking_model=self.tracking_model, source_type=self.source_type
         )
         file_object._get_file_extension()
@@ -69,21 +128,20 @@ class ExcelHelper:
             file_object.object_buffer.seek(0)
             file_input = BytesIO(file_object.object_buffer.read())  # this is BytesIO
 
-        # Choose engine based on extension
+        # Choose reader based on extension
         if ext == ".xls":
+            # pandas is only needed for legacy .xls, so load it on first use
+            import pandas as pd
+
             df_dict = pd.read_excel(
                 file_input, sheet_name=None, header=None, dtype=str, engine="xlrd"
             )
+            all_rows = []
+            for sheet_name, sheet_df in df_dict.items():
+                sheet_df.fillna("", inplace=True)
+                all_rows.extend(sheet_df.astype(str).values.tolist())
         else:
-            df_dict = pd.read_excel(
-                file_input, sheet_name=None, header=None, dtype=str, engine="openpyxl"
-            )
-
-        # Extract all rows from all sheets
-        all_rows = []
-        for sheet_name, sheet_df in df_dict.items():
-            sheet_df.fillna("", inplace=True)
-            all_rows.extend(sheet_df.astype(str).values.tolist())
+            all_rows = _read_xlsx_rows(file_input)
 
         return [row for row in all_rows if any(cell.strip() for cell in row)]
 
@@ -119,13 +177,10 @@ class ExcelHelper:
         return metadata
 
     def _has_inner_metadata(self, cell: str) -> bool:
-        return (
-            re.search(rf"\(([^()]*?{re.escape(self.separator)}[^()]*)\)", cell)
-            is not None
-        )
+        return _inner_metadata_patterns(self.separator)[0].search(cell) is not None
 
     def _extract_inner_metadata(self, cell: str, metadata: Dict[str, str]) -> None:
-        match = re.search(rf"(.*)\(([^()]*?{re.escape(self.separator)}[^()]*)\)", cell)
+        match = _inner_metadata_patterns(self.separator)[1].search(cell)
         if match:
             metadata["header"] = cell
             inner = match.group(2)
@@ -134,9 +189,8 @@ class ExcelHelper:
                 metadata[key] = value or None
 
     def _is_url(self, value: str) -> bool:
-        if not isinstance(value, str):
-            return False
-        return value.lower().startswith("http")
+        # Plain case-insensitive prefix test; only the first 4 chars are lowered
+        return isinstance(value, str) and value[:4].lower() == "http"
 
     def _extract_standard_metadata(
         self, cell: str, idx: int, cells: List[str], metadata: Dict[str, str]
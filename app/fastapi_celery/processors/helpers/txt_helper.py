@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Iterator
+import io
 import logging
 
 from utils import file_extraction
@@ -22,6 +24,8 @@ class TxtHelper:
     Base class for TXT processors. Handles file extraction and common operations.
     """
 
+    __slots__ = ("tracking_model", "source_type", "encoding", "capacity", "document_type")
+
     def __init__(
         self,
         tracking_model: TrackingModel,
@@ -37,29 +41,39 @@ class TxtHelper:
         self.capacity = None
         self.document_type = None
 
-    def extract_text(self) -> str:
+    def iter_lines(self) -> Iterator[str]:
         """
-        Extract and return the text content of the file using the specified encoding.
+        Yield the file content line by line (without line endings) using the specified encoding.
         """
-        file_object = file_extraction.FileExtensionProcessor(tracking_model=self.tracking_model, source_type=self.source_type)
+        file_object = file_extraction.get_file_processor(
+            tracking_model=self.tracking_model, source_type=self.source_type
+        )
 
-        self.capacity = file_object._get_file_capacity()
-        self.document_type = file_object._get_document_type()
+        # Already resolved while the file processor was prepared
+        self.capacity = file_object.file_size
+        self.document_type = file_object.document_type
 
-        if file_object.source_type == "local":
-            with open(file_object.file_path, "r", encoding=self.encoding) as f:
-                return f.read()
+        if file_object.source_type == SourceType.LOCAL:
+            with open(file_object.file_path, "r", encoding=self.encoding, buffering=1 << 16) as f:
+                for line in f:
+                    yield line.rstrip("\r\n")
         else:
             file_object.object_buffer.seek(0)
-            return file_object.object_buffer.read().decode(self.encoding)
+            wrapper = io.TextIOWrapper(file_object.object_buffer, encoding=self.encoding)
+            try:
+                for line in wrapper:
+                    yield line.rstrip("\r\n")
+            finally:
+                # Leave the underlying buffer open for the file object that owns it
+                wrapper.detach()
 
     def parse_file_to_json(self, parse_func) -> PODataParsed:
         """
-        Extract text, parse lines with given function, and return structured output.
+        Stream lines into the given parse function and return structured output.
         """
-        text = self.extract_text()
-        lines = text.splitlines()
-        items = parse_func(lines)
+        items = parse_func(self.iter_lines())
+        if not isinstance(items, list):
+            items = list(items)
 
         return PODataParsed(
             original_file_path=self.tracking_model.file_path,
@@ -101,7 +101,8 @@ class ExcelMasterProcessor(excel_helper.ExcelHelper):
             )
 
     def _clean_row(self, row):
-        return [str(cell).strip() for cell in row]
+        # ExcelHelper.read_rows always yields string cells
+        return [cell.strip() for cell in row]
 
     def _extract_table_block(self, start_index: int, header_row: list) -> tuple:
         table_block = []
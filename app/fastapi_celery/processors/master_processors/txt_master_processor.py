@@ -48,7 +48,9 @@ class TxtMasterProcessor:
                 and capacity (str).
         """
         try:
-            file_object = file_extraction.FileExtensionProcessor(tracking_model=self.tracking_model, source_type=self.source)
+            file_object = file_extraction.get_file_processor(
+                tracking_model=self.tracking_model, source_type=self.source
+            )
             document_type = file_object._get_document_type()
             capacity = file_object._get_file_capacity()
             original_file_path = self.tracking_model.file_path
@@ -1,6 +1,7 @@
 # Standard Library Imports
 from datetime import datetime, timezone
 import logging
+from models.class_models import FileRecord
 from models.tracking_models import TrackingModel
 from processors.processor_nodes import WORKFLOW_PROCESSORS
 from utils import log_helper
@@ -43,7 +44,7 @@ class ProcessorBase:
         """
 
         self.tracking_model = tracking_model
-        self.file_record = {}
+        self.file_record: FileRecord | None = None
         self._register_workflow_processors()
 
     def run(self):
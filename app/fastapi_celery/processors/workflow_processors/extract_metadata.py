@@ -1,9 +1,10 @@
 import logging
 import traceback
+from dataclasses import asdict
 from datetime import datetime, timezone
 from utils import file_extraction, log_helper
 from models.tracking_models import ServiceLog, LogType
-from models.class_models import StatusEnum, StepOutput
+from models.class_models import FileRecord, StatusEnum, StepOutput
 
 # === Logging setup ===
 logger_name = f"Workflow Processor - {__name__}"
@@ -30,28 +31,28 @@ def extract_metadata(self) -> StepOutput:
         Exception: Propagates any exception for higher-level retry or handling.
     """
     try:
-        file_processor = file_extraction.FileExtensionProcessor(self.tracking_model)
+        file_processor = file_extraction.get_file_processor(self.tracking_model)
 
-        self.file_record = {
-            "file_path": file_processor.file_path,
-            "file_path_parent": file_processor.file_path_parent,
-            "source_type": file_processor.source_type,
-            "file_size": file_processor.file_size,
-            "file_name": file_processor.file_name,
-            "file_name_wo_ext": file_processor.file_name_wo_ext,
-            "file_extension": file_processor.file_extension,
-            "document_type": file_processor.document_type,
-            "raw_bucket_name": file_processor.raw_bucket_name,
-            "target_bucket_name": file_processor.target_bucket_name,
-            "proceed_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        self.file_record = FileRecord(
+            file_path=file_processor.file_path,
+            file_path_parent=file_processor.file_path_parent,
+            source_type=file_processor.source_type,
+            file_size=file_processor.file_size,
+            file_name=file_processor.file_name,
+            file_name_wo_ext=file_processor.file_name_wo_ext,
+            file_extension=file_processor.file_extension,
+            document_type=file_processor.document_type,
+            raw_bucket_name=file_processor.raw_bucket_name,
+            target_bucket_name=file_processor.target_bucket_name,
+            proceed_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
         logger.info(
             f"[{self.tracking_model.request_id}] Metadata extracted for file: {file_processor.file_path}",
             extra={
                 "service": ServiceLog.FILE_EXTRACTION,
                 "log_type": LogType.TASK,
-                "data": self.file_record,
+                "data": asdict(self.file_record),
             },
         )
 
@@ -71,7 +72,7 @@ def extract_metadata(self) -> StepOutput:
             extra={
                 "service": ServiceLog.FILE_EXTRACTION,
                 "log_type": LogType.ERROR,
-                "data": self.tracking_model.model_dump(),
+                "data": self.tracking_model.to_log_dict(),
                 "traceback": full_tb,  # structured traceback for ELK
             },
         )
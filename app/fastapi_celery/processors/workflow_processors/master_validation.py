@@ -2,6 +2,7 @@ import logging
 from typing import List, Dict, Any
 from utils import log_helper
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from connections.be_connection import BEConnector
 from models.class_models import (
@@ -47,37 +48,13 @@ class MasterValidation:
         """
         # Sort schema by posidx to compare with header order
         sorted_schema = sorted(header_reference, key=lambda x: x["posidx"])
+        expected_headers = [schema_item["name"] for schema_item in sorted_schema]
         error_messages = []
 
-        if len(sorted_schema) != len(self.masterdata_headers):
-            logger.error(
-                f"Length mismatch: schema has {len(sorted_schema)} fields, headers have {len(self.masterdata_headers)}",
-                extra={
-                    "service": ServiceLog.METADATA_VALIDATION,
-                    "log_type": LogType.ERROR,
-                    "data": self.tracking_model,
-                },
-            )
-            message = (
-                f"Length mismatch: schema has {len(sorted_schema)} fields, "
-                f"headers have {len(self.masterdata_headers)}"
-            )
-            error_messages.append(message)
+        # Matching headers (the common case) need no per-position walk
+        if expected_headers != list(self.masterdata_headers):
+            error_messages = self._header_mismatches(expected_headers)
 
-        for idx, (schema_item, header) in enumerate(
-            zip(sorted_schema, self.masterdata_headers)
-        ):
-            if schema_item["name"] != header:
-                logger.error(
-                    f"Mismatch at position {idx}: expected '{schema_item['name']}', got '{header}'",
-                    extra={
-                        "service": ServiceLog.METADATA_VALIDATION,
-                        "log_type": LogType.ERROR,
-                        "data": self.tracking_model,
-                    },
-                )
-                message = f"Mismatch at position {idx}: expected '{schema_item['name']}', got '{header}'"
-                error_messages.append(message)
         if not error_messages:
             logger.info(
                 f"{__name__} successfully executed!",
@@ -102,6 +79,25 @@ class MasterValidation:
             )
         return updated
 
+    def _header_mismatches(self, expected_headers: List[str]) -> List[str]:
+        error_messages = []
+        if len(expected_headers) != len(self.masterdata_headers):
+            message = (
+                f"Length mismatch: schema has {len(expected_headers)} fields, "
+                f"headers have {len(self.masterdata_headers)}"
+            )
+            logger.error(message, extra=self._log_extra(LogType.ERROR))
+            error_messages.append(message)
+
+        for idx, (expected, header) in enumerate(
+            zip(expected_headers, self.masterdata_headers)
+        ):
+            if expected != header:
+                message = f"Mismatch at position {idx}: expected '{expected}', got '{header}'"
+                logger.error(message, extra=self._log_extra(LogType.ERROR))
+                error_messages.append(message)
+        return error_messages
+
     def data_validation(self, data_reference: List[Dict[str, Any]]) -> MasterDataParsed:
         """
         Validates a list of data records against a reference schema using pandas.
@@ -128,14 +124,18 @@ class MasterValidation:
                 return self._fail(f"Missing column '{name}' in data.")
 
             col = self.masterdata[name]
-            if not nullable and self._has_null(col):
-                idx = self._first_null_index(col)
-                return self._fail(
-                    f"Row {idx}: Field '{name}' is required but missing/empty."
-                )
-
-            if self._has_invalid_type(col, datatype, maxlength):
-                idx = self._first_invalid_index(col, datatype, maxlength)
+            # Convert once; each mask is built once and only located when it has a hit
+            col_str = col.astype(str)
+            if not nullable:
+                null_mask = self._null_mask(col, col_str)
+                if null_mask.any():
+                    return self._fail(
+                        f"Row {null_mask.idxmax()}: Field '{name}' is required but missing/empty."
+                    )
+
+            invalid_mask = self._build_type_mask(col_str, datatype, maxlength)
+            if invalid_mask.any():
+                idx = invalid_mask.idxmax()
                 val = col.iloc[idx]
                 return self._fail(
                     f"Row {idx}: Field '{name}' has invalid value '{val}' for type '{datatype}'."
@@ -165,36 +165,41 @@ class MasterValidation:
             "data": self.tracking_model,
         }
 
-    def _has_null(self, col: pd.Series) -> bool:
-        return (col.isnull() | col.astype(str).str.strip().eq("")).any()
-
-    def _first_null_index(self, col: pd.Series) -> int:
-        null_mask = col.isnull() | col.astype(str).str.strip().eq("")
-        return null_mask.idxmax()
-
-    def _has_invalid_type(
-        self, col: pd.Series, dtype: str, maxlength: int | None
-    ) -> bool:
-        return self._build_type_mask(col, dtype, maxlength).any()
-
-    def _first_invalid_index(
-        self, col: pd.Series, dtype: str, maxlength: int | None
-    ) -> int:
-        return self._build_type_mask(col, dtype, maxlength).idxmax()
+    def _null_mask(self, col: pd.Series, col_str: pd.Series) -> pd.Series:
+        return col.isnull() | col_str.str.strip().eq("")
 
     def _build_type_mask(
-        self, col: pd.Series, dtype: str, maxlength: int | None
+        self, col_str: pd.Series, dtype: str, maxlength: int | None
     ) -> pd.Series:
-        col_str = col.astype(str)
         if dtype in ("int", "bigint"):
-            return ~col_str.str.fullmatch(r"-?\d+")
+            return self._invalid_int_mask(col_str)
         elif dtype == "float":
             return ~col_str.str.fullmatch(r"-?\d+(\.\d+)?")
         elif dtype == "timestamp":
-            return ~col_str.apply(lambda x: self._is_valid_date(x, "%Y%m%d"))
+            return self._invalid_date_mask(col_str, "%Y%m%d")
         elif dtype == "string" and maxlength is not None:
             return col_str.str.len() > maxlength
-        return pd.Series([False] * len(col))
+        return pd.Series(False, index=col_str.index)
+
+    def _invalid_int_mask(self, col_str: pd.Series) -> pd.Series:
+        # Same rule as fullmatch(r"-?\d+"), checked with NumPy's string ufuncs
+        # instead of running the regex on every cell
+        values = col_str.to_numpy(dtype=np.dtypes.StringDType())
+        digits = np.strings.lstrip(values, "-")
+        valid = np.strings.isdecimal(digits) & (
+            np.strings.str_len(values) - np.strings.str_len(digits) <= 1
+        )
+        return pd.Series(~valid, index=col_str.index)
+
+    def _invalid_date_mask(self, col_str: pd.Series, fmt: str) -> pd.Series:
+        # Parse the whole column in one vectorized call. Cells pandas rejects (e.g. SAP's
+        # 99991231, outside the ns range) and cells that are not plain 8-digit strings
+        # (pandas also accepts "now"/"today") are re-checked one by one with strptime
+        mask = pd.to_datetime(col_str, format=fmt, errors="coerce").isna()
+        recheck = mask | ~col_str.str.fullmatch(r"\d{8}").fillna(False).astype(bool)
+        if recheck.any():
+            mask.loc[recheck] = ~col_str[recheck].map(lambda x: self._is_valid_date(x, fmt)).astype(bool)
+        return mask
 
     def _is_valid_date(self, value: str, fmt) -> bool:
         try:
@@ -217,7 +222,7 @@ async def masterdata_header_validation(self, input_data: StepOutput) -> StepOutp
     """
     valid_headers = await BEConnector(
         ApiUrl.MASTERDATA_HEADER_VALIDATION.full_url(),
-        params={"fileName": self.file_record["file_name"]},
+        params={"fileName": self.file_record.file_name},
     ).get()
     master_data = MasterValidation(masterdata_json=input_data.output, tracking_model=self.tracking_model)
     header_validation_result = master_data.header_validation(
@@ -252,7 +257,7 @@ async def masterdata_data_validation(self, input_data: StepOutput) -> StepOutput
     """
     valid_data = await BEConnector(
         ApiUrl.MASTERDATA_COLUMN_VALIDATION.full_url(),
-        params={"fileName": self.file_record["file_name"]},
+        params={"fileName": self.file_record.file_name},
     ).get()
     master_data = MasterValidation(masterdata_json=input_data.output, tracking_model=self.tracking_model)
     data_validation_result = master_data.data_validation(data_reference=valid_data)
@@ -53,22 +53,22 @@ def write_json_to_s3(
         )
 
     except Exception as e:
+        # Format the traceback once; the structured list already carries it to ELK
         full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.error(
             f"Exception occurred while executing step 'write_json_to_s3'",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.ERROR,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
                 "traceback": full_tb,
             },
-            exc_info=True,
         )
 
         return StepOutput(
             output=None,
             step_status=StatusEnum.FAILED,
-            step_failure_message=traceback.format_exc(),
+            step_failure_message=["".join(full_tb)],
         )
 
 
@@ -92,7 +92,7 @@ def get_step_result_from_s3(self, step: WorkflowStep, step_config: StepDefinitio
         version_folder=None
     )
 
-    keys = read_n_write_s3.list_objects_with_prefix(bucket_name=self.file_record.target_bucket_name, prefix=s3_key_prefix)
+    keys = read_n_write_s3.iter_objects_with_prefix(bucket_name=self.file_record.target_bucket_name, prefix=s3_key_prefix)
     key = read_n_write_s3.select_latest_rerun(keys=keys, base_filename=self.file_record.file_name_wo_ext)
     data = read_n_write_s3.read_json_from_s3(bucket_name=self.file_record.target_bucket_name, object_name=key)
 
@@ -102,7 +102,7 @@ def get_step_result_from_s3(self, step: WorkflowStep, step_config: StepDefinitio
             f"attempt {self.tracking_model.rerun_attempt}. Will rerun.",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
         )
         return None
@@ -115,7 +115,7 @@ def get_step_result_from_s3(self, step: WorkflowStep, step_config: StepDefinitio
             f"attempt {rerun_attempt} has step_status=1. Skipping.",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
         )
     else:
@@ -124,7 +124,7 @@ def get_step_result_from_s3(self, step: WorkflowStep, step_config: StepDefinitio
             f"attempt {rerun_attempt} has step_status={step_status}. Will rerun.",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
         )
     return template_helper.parse_data(document_type=self.file_record.document_type, data=data)
@@ -4,9 +4,9 @@ import config_loader
 from models.class_models import DocumentType, StepOutput, StatusEnum
 from models.tracking_models import ServiceLog, LogType
 from utils import read_n_write_s3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
-import re
 
 # ===
 # Set up logging
@@ -18,6 +18,9 @@ base_logger = logging.getLogger(logger_name)
 logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 # ===
 
+# Shared pool for concurrent S3 copies (boto3 clients are thread-safe)
+_copy_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="s3-copy")
+
 
 def write_raw_to_s3(self) -> StepOutput:
  
@@ -27,7 +30,7 @@ def write_raw_to_s3(self) -> StepOutput:
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.TASK,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
         )
 
@@ -43,44 +46,58 @@ def write_raw_to_s3(self) -> StepOutput:
             version_folder=None
         )
 
-        result = read_n_write_s3.copy_object_between_buckets(
+        # Refresh the current copy while the next version folder is being resolved
+        current_copy = _copy_executor.submit(
+            read_n_write_s3.copy_object_between_buckets,
             source_bucket=self.file_record.raw_bucket_name,
             source_key=self.file_record.file_path,
             dest_bucket=self.file_record.target_bucket_name,
             dest_key=s3_key_prefix,
         )
-           
+
         version_prefix = f"versioning/{self.file_record.file_name_wo_ext}/"
-        existing_keys = read_n_write_s3.list_objects_with_prefix(
-            bucket_name= self.file_record.target_bucket_name,
-            prefix= version_prefix
+        # Only the "versioning/{stem}/NNN/" folders are listed, not every object
+        existing_folders = read_n_write_s3.list_common_prefixes(
+            bucket_name=self.file_record.target_bucket_name,
+            prefix=version_prefix,
         )
-        version_number = 1
-        if existing_keys:  # pragma: no cover  # NOSONAR
-            numbers = []
-            for key in existing_keys:
-                match = re.search(rf"versioning/{re.escape(self.file_record.file_name_wo_ext)}/(\d{{3}})/", key)
-                if match:
-                    numbers.append(int(match.group(1)))
-            if numbers:
-                version_number = max(numbers) + 1
- 
+        # Read NNN at a fixed offset after the known prefix
+        prefix_len = len(version_prefix)
+        version_number = max(
+            (
+                int(folder[prefix_len:prefix_len + 3])
+                for folder in existing_folders
+                if len(folder) > prefix_len + 3
+                and folder[prefix_len + 3] == "/"
+                and folder[prefix_len:prefix_len + 3].isdigit()
+            ),
+            default=0,
+        ) + 1
+
         version_folder = f"{version_number:03d}"
         version_key = f"{version_prefix}{version_folder}/{self.file_record.file_name}"
- 
-        read_n_write_s3.copy_object_between_buckets(
+
+        version_copy = _copy_executor.submit(
+            read_n_write_s3.copy_object_between_buckets,
             source_bucket=self.file_record.raw_bucket_name,
             source_key=self.file_record.file_path,
             dest_bucket=self.file_record.target_bucket_name,
             dest_key=version_key,
         )
- 
+
+        # Both copies are independent server-side copies of the raw file
+        result = current_copy.result()
+        version_result = version_copy.result()
+        for dest_key, copy_result in ((s3_key_prefix, result), (version_key, version_result)):
+            if copy_result.get("status") == "Failed":
+                raise RuntimeError(f"Failed to copy raw file to '{dest_key}': {copy_result.get('error')}")
+
         logger.info(
             "write_raw_to_s3 completed.",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.TASK,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
         )
  
@@ -96,7 +113,7 @@ def write_raw_to_s3(self) -> StepOutput:
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.ERROR,
-                "data": self.tracking_model,
+                "data": self.tracking_model.to_log_dict(),
             },
             exc_info=True,
             )
@@ -1,10 +1,13 @@
 from processors.processor_nodes import BUCKET_MAP
-from models.class_models import DocumentType, StepDefinition, WorkflowStep
+from models.class_models import DocumentType, FileRecord, StepDefinition, WorkflowStep
 from datetime import datetime, timezone
+from functools import lru_cache
 import os
+import time
 import config_loader
 
 
+@lru_cache(maxsize=256)
 def get_bucket_name(
     document_type: DocumentType,
     bucket_type: str,
@@ -13,7 +16,7 @@ def get_bucket_name(
 ):
     """
     Retrieve the corresponding S3 bucket name based on document type, bucket type,
-    project name, and SAP master data flag.
+    project name, and SAP master data flag. Resolved names are cached per argument tuple.
 
     Raises:
         ValueError: If the bucket name cannot be resolved due to invalid inputs or missing mappings.
@@ -51,73 +54,91 @@ def get_bucket_name(
         raise ValueError(f"Failed to resolve bucket name: {e}")
 
 
-def get_s3_key_prefix(
-    request_id: str,
-    file_record: dict,
-    step: WorkflowStep | None = None,
-    step_config: StepDefinition | None = None,
-    rerun_attempt: int | None = None,
-    is_master_data: bool | None = None,
-    target_folder: str | None = None,
-    is_full_prefix: bool | None = None,
-    version_folder: str | None = None,
-) -> str:
+@lru_cache(maxsize=1)
+def _utc_date_str(minute: int) -> str:
+    """Return the UTC date (YYYYMMDD) for the given epoch minute, cached for the current minute."""
+    return datetime.fromtimestamp(minute * 60, timezone.utc).strftime("%Y%m%d")
 
-    date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
-    step_order = f"{int(step.stepOrder):02}" if step else ""
 
-    file_name = file_record.get("file_name")
-    file_name_wo_ext = file_record.get("file_name_wo_ext")
+def _prefix_step(
+    request_id: str,
+    file_record: FileRecord,
+    step: WorkflowStep | None,
+    step_config: StepDefinition | None,
+    rerun_attempt: int | None,
+    is_master_data: bool | None,
+    is_full_prefix: bool | None,
+) -> str:
+    """Build the per-step prefix, ending with the output object name when is_full_prefix is set."""
+    file_name_wo_ext = file_record.file_name_wo_ext
 
     if is_master_data:
         prefix_part = file_name_wo_ext
     else:
-        folder = file_record.get("folder_name")
-        customer = file_record.get("customer_foldername")
-        prefix_part = f"{folder}/{customer}"
+        prefix_part = f"{file_record.folder_name}/{file_record.customer_foldername}"
+
+    step_order = f"{int(step.stepOrder):02}" if step else ""
 
-    if rerun_attempt:
+    if not is_full_prefix:
+        object_name = ""
+    elif rerun_attempt:
         object_name = f"{file_name_wo_ext}_rerun_{rerun_attempt}.json"
     else:
         object_name = f"{file_name_wo_ext}.json"
 
-    if not target_folder and is_full_prefix:
-        target_folder = step_config.target_store_data
-        return (
-            f"{target_folder}/"
-            f"{prefix_part}/{date_str}/"
-            f"{request_id}/"
-            f"{step_order}_{step.stepName}/"
-            f"{object_name}"
-        )
-    
-    elif not target_folder and not is_full_prefix:
-        target_folder = step_config.target_store_data
-        return (
-            f"{target_folder}/"
-            f"{prefix_part}/{date_str}/"
-            f"{request_id}/"
-            f"{step_order}_{step.stepName}/"
-        )
-    
-    elif is_master_data and target_folder == "master_data":
-        return (
-            f"{target_folder}/"
-            f"{file_name_wo_ext}/"
-            f"{file_name}"
-        )
-    
-    elif is_master_data and target_folder == "process_data":
-        return (
-            f"{target_folder}/"
-            f"{file_name_wo_ext}/"
-            f"{file_name_wo_ext}_{file_record["proceed_at"]}.json"
-        )
-    
-    elif is_master_data and target_folder == "versioning":
-        return (
-            f"{target_folder}/"
-            f"{file_name_wo_ext}/"
-            f"{version_folder}/"
-            f"{file_name}"
+    return "/".join((
+        step_config.target_store_data,
+        prefix_part,
+        _utc_date_str(int(time.time() // 60)),
+        request_id,
+        f"{step_order}_{step.stepName}",
+        object_name,
+    ))
+
+
+def _prefix_master_data(target_folder: str, file_record: FileRecord, version_folder: str | None) -> str:
+    return f"{target_folder}/{file_record.file_name_wo_ext}/{file_record.file_name}"
+
+
+def _prefix_process_data(target_folder: str, file_record: FileRecord, version_folder: str | None) -> str:
+    file_name_wo_ext = file_record.file_name_wo_ext
+    proceed_at = file_record.proceed_at
+    return f"{target_folder}/{file_name_wo_ext}/{file_name_wo_ext}_{proceed_at}.json"
+
+
+def _prefix_versioning(target_folder: str, file_record: FileRecord, version_folder: str | None) -> str:
+    return f"{target_folder}/{file_record.file_name_wo_ext}/{version_folder}/{file_record.file_name}"
+
+
+# Master data target folders and their prefix builders
+_MASTER_DATA_PREFIX_BUILDERS = {
+    "master_data": _prefix_master_data,
+    "process_data": _prefix_process_data,
+    "versioning": _prefix_versioning,
+}
+
+
+def get_s3_key_prefix(
+    request_id: str,
+    file_record: FileRecord,
+    step: WorkflowStep | None = None,
+    step_config: StepDefinition | None = None,
+    rerun_attempt: int | None = None,
+    is_master_data: bool | None = None,
+    target_folder: str | None = None,
+    is_full_prefix: bool | None = None,
+    version_folder: str | None = None,
+) -> str:
+    """
+    Build the S3 key (or key prefix) for a workflow output.
+
+    Without a target_folder the prefix is derived from the step's target store; master data
+    files may instead target the master_data, process_data or versioning folders.
+    """
+    if not target_folder:
+        return _prefix_step(
+            request_id, file_record, step, step_config, rerun_attempt, is_master_data, is_full_prefix
         )
+
+    builder = _MASTER_DATA_PREFIX_BUILDERS.get(target_folder) if is_master_data else None
+    return builder(target_folder, file_record, version_folder) if builder else None
@@ -1,3 +1,4 @@
+import io
 import os
 import json
 import traceback
@@ -5,9 +6,8 @@ import logging
 from pathlib import Path, PurePosixPath
 from typing import Optional
 
-from utils import log_helper, read_n_write_s3
+from utils import log_helper, read_n_write_s3, trace_context
 from utils.bucket_helper import get_bucket_name
-from connections import aws_connection
 from models.class_models import SourceType, DocumentType
 from models.tracking_models import ServiceLog, LogType, TrackingModel
 import config_loader
@@ -22,6 +22,10 @@ logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 types_string = config_loader.get_config_value("support_types", "types")
 types_list = json.loads(types_string)
 
+_MASTER_DATA_NEEDLE = f"/{DocumentType.MASTER_DATA.value.lower()}/"
+_KB = 1 << 10
+_MB = 1 << 20
+
 
 class FileExtensionProcessor:
     """
@@ -29,6 +33,24 @@ class FileExtensionProcessor:
     from local or S3 storage sources.
     """
 
+    __slots__ = (
+        "tracking_model",
+        "file_path",
+        "_path",
+        "file_path_parent",
+        "source_type",
+        "_object_buffer",
+        "_s3_head",
+        "file_size",
+        "file_name",
+        "file_name_wo_ext",
+        "file_extension",
+        "client",
+        "document_type",
+        "raw_bucket_name",
+        "target_bucket_name",
+    )
+
     def __init__(self, tracking_model: TrackingModel, source_type: SourceType = SourceType.SFTP):
         """
         Initialize the FileExtensionProcessor with context information.
@@ -45,9 +67,13 @@ class FileExtensionProcessor:
 
         self.tracking_model = tracking_model
         self.file_path: str = tracking_model.file_path
+        self._path: PurePosixPath | Path = (
+            Path(self.file_path) if source_type == SourceType.LOCAL else PurePosixPath(self.file_path)
+        )
         self.file_path_parent: str | None = None
         self.source_type: SourceType = source_type
-        self.object_buffer: bytes | None = None
+        self._object_buffer: io.BytesIO | None = None
+        self._s3_head: dict | None = None
         self.file_size: str | None = None
         self.file_name: str | None = None
         self.file_name_wo_ext: str | None = None
@@ -68,7 +94,7 @@ class FileExtensionProcessor:
         if self.source_type == SourceType.LOCAL:
             self._load_local_file()
         else:
-            self._load_s3_file()
+            self._probe_s3_metadata()
 
         self._get_file_extension()
         self._get_file_capacity()
@@ -84,43 +110,72 @@ class FileExtensionProcessor:
 
             if not os.path.isfile(self.file_path):
                 raise FileNotFoundError(f"Failed to find local file '{self.file_path}'.")
-            self.file_name = Path(self.file_path).name
-            self.file_path_parent = str(Path(self.file_path).parent) + "/"
+            self.file_name = self._path.name
+            self.file_path_parent = f"{self._path.parent}/"
 
         except Exception as e:
             raise FileNotFoundError(
                 f"Failed to load local file '{self.file_path}'. Original error: {e}"
             ) from e
 
-    def _load_s3_file(self) -> None:
+    @property
+    def object_buffer(self) -> io.BytesIO | None:
+        """File content buffer, downloaded from S3 on first access."""
+        if self._object_buffer is None and self.source_type != SourceType.LOCAL:
+            self._object_buffer = self._open_s3_body()
+        return self._object_buffer
+
+    @object_buffer.setter
+    def object_buffer(self, value: io.BytesIO | None) -> None:
+        self._object_buffer = value
+
+    def _probe_s3_metadata(self) -> None:
         """
-        Load file content from an S3 bucket into memory.
+        Check the S3 object with a single HEAD request, without downloading its content.
 
         Raises:
-            FileNotFoundError: If the S3 object does not exist or cannot be loaded.
+            FileNotFoundError: If the S3 object does not exist or cannot be accessed.
         """
         try:
-            s3_connector = aws_connection.S3Connector(bucket_name=self.raw_bucket_name)
-            self.client = s3_connector.client
+            # Reuse the cached connector so the bucket is only checked once per process
+            self.client = read_n_write_s3.get_connector(self.raw_bucket_name).client
 
-            buffer = read_n_write_s3.get_object(
+            exists, head = read_n_write_s3.object_exists(
                 client=self.client,
                 bucket_name=self.raw_bucket_name,
                 object_name=self.file_path,
             )
 
-            if not buffer:
+            if not exists:
                 raise FileNotFoundError(f"Failed to find S3 object '{self.file_path}' in bucket '{self.raw_bucket_name}'.")
 
-            self.object_buffer = buffer
-            self.file_name = Path(self.file_path).name
-            self.file_path_parent = str(Path(self.file_path).parent) + "/"
+            self._s3_head = head
+            self.file_name = self._path.name
+            self.file_path_parent = f"{self._path.parent}/"
 
         except Exception as e:
             raise FileNotFoundError(
                 f"Failed to load file '{self.file_path}' from S3. Original error: {e}"
             ) from e
 
+    def _open_s3_body(self) -> io.BytesIO:
+        """
+        Download the S3 object content into memory.
+
+        Raises:
+            FileNotFoundError: If the S3 object cannot be downloaded.
+        """
+        buffer = read_n_write_s3.get_object(
+            client=self.client,
+            bucket_name=self.raw_bucket_name,
+            object_name=self.file_path,
+        )
+
+        if not buffer:
+            raise FileNotFoundError(f"Failed to find S3 object '{self.file_path}' in bucket '{self.raw_bucket_name}'.")
+
+        return buffer
+
     def _get_file_extension(self) -> None:
         """
         Extract and validate the file extension.
@@ -130,7 +185,7 @@ class FileExtensionProcessor:
             TypeError: If the extension is not supported.
         """
         try:
-            suffix = Path(self.file_path).suffix.lower()
+            suffix = self._path.suffix.lower()
 
             if not suffix:
                 raise ValueError(f"File '{self.file_path}' has no extension.")
@@ -141,67 +196,73 @@ class FileExtensionProcessor:
                 )
 
             self.file_extension = suffix
-            self.file_name_wo_ext = Path(self.file_path).stem
+            self.file_name_wo_ext = self._path.stem
 
         except Exception as e:
             raise ValueError(
                 f"Failed to get file extension for '{self.file_path}'. Original error: {e}"
             ) from e
 
-    def _get_file_capacity(self) -> None:
+    def _get_file_capacity(self) -> str:
         """
-        Determine and format the file size in KB or MB.
+        Determine and format the file size in KB or MB. The result is computed once.
 
         Raises:
             FileNotFoundError: If the file cannot be accessed.
         """
+        if self.file_size is not None:
+            return self.file_size
+
         try:
             if self.source_type == SourceType.LOCAL:
                 if not os.path.exists(self.file_path):
                     raise FileNotFoundError(f"Failed to find local file '{self.file_path}'.")
                 size_bytes = os.path.getsize(self.file_path)
             else:
-                head = self.client.head_object(Bucket=self.raw_bucket_name, Key=self.file_path)
+                head = self._s3_head or self.client.head_object(Bucket=self.raw_bucket_name, Key=self.file_path)
                 size_bytes = head.get("ContentLength", 0)
 
-            self.file_size = self._format_size(size_bytes)
+            self.file_size = (
+                f"{size_bytes / _MB:.2f} MB" if size_bytes >= _MB else f"{size_bytes / _KB:.2f} KB"
+            )
         except Exception as e:
             raise FileNotFoundError(
                 f"Failed to determine file size for '{self.file_path}'. Original error: {e}"
             ) from e
 
-    def _get_document_type(self) -> None:
+        return self.file_size
+
+    def _get_document_type(self) -> DocumentType:
         """
         Determine the document type (MASTER_DATA or ORDER) based on file path.
+        The result is computed once.
 
         Raises:
             ValueError: If file path is invalid or cannot be parsed.
         """
-        try:
-            # Normalize path components based on the file source
-            parts = (
-                Path(os.path.normpath(self.file_path)).parts
-                if self.source_type == SourceType.LOCAL
-                else PurePosixPath(self.file_path).parts
-            )
+        if self.document_type is not None:
+            return self.document_type
 
-            if not parts:
+        try:
+            if not self._path.parts:
                 raise ValueError(
                     f"Invalid file path: '{self.file_path}'. No path components found."
                 )
             # Determine document type by folder naming
-            document_type = (
+            path = self._path.as_posix().lower()
+            self.document_type = (
                 DocumentType.MASTER_DATA
-                if any(part.lower() == DocumentType.MASTER_DATA.value for part in parts)
+                if _MASTER_DATA_NEEDLE in path or path.startswith(_MASTER_DATA_NEEDLE[1:])
                 else DocumentType.ORDER
             )
-            self.document_type = document_type
 
         except Exception as e:
             raise ValueError(
                 f"Failed to determine document type for '{self.file_path}'. Original error: {e}"
             ) from e
 
+        return self.document_type
+
     def _get_bucket_name(self) -> None:
         """
         Retrieve the raw and target S3 bucket names based on document type and project context.
@@ -228,9 +289,20 @@ class FileExtensionProcessor:
                 f"Failed to retrieve bucket names for document type '{self.document_type}'. Original error: {e}"
             ) from e
 
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Convert byte size to a readable KB or MB string."""
-        if size_bytes / (1024**2) >= 1:
-            return f"{size_bytes / (1024**2):.2f} MB"
-        return f"{size_bytes / 1024:.2f} KB"
\ No newline at end of file
+
+def get_file_processor(
+    tracking_model: TrackingModel, source_type: SourceType = SourceType.SFTP
+) -> FileExtensionProcessor:
+    """
+    Return the FileExtensionProcessor for this file, reusing the one already built
+    earlier in the same workflow run (trace) instead of re-resolving its metadata.
+    A reused processor has its buffer rewound so every caller reads from the start.
+    """
+    key = ("file_processor", str(tracking_model.file_path), source_type)
+    file_processor = trace_context.get_cached(key)
+    if file_processor is None:
+        file_processor = FileExtensionProcessor(tracking_model=tracking_model, source_type=source_type)
+        trace_context.set_cached(key, file_processor)
+    elif file_processor._object_buffer is not None:
+        file_processor._object_buffer.seek(0)
+    return file_processor
@@ -1,6 +1,18 @@
+import atexit
+import collections
 import logging.config
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+import ecs_logging
+import httpx
 import config_loader
 from models.tracking_models import LogType, ServiceLog
+from utils import trace_context
 
 LOG_COLORS = {
     "DEBUG": "cyan",
@@ -19,12 +31,258 @@ EXCLUDED_FIELDS = [
 ENV = config_loader.get_config_value("environment", "env")
 LOG_LEVEL = "DEBUG" if ENV == "dev" else "INFO"
 
+# Seconds during which a repeated DEBUG/INFO record is dropped.
+RATE_LIMIT_WINDOW = 5.0
+
+# Optional Elasticsearch sink; disabled when ELK_URL is not set.
+ELK_URL = config_loader.get_env_variable("ELK_URL")
+ELK_INDEX = config_loader.get_env_variable("ELK_INDEX", "datahub-logs")
+ELK_BATCH_SIZE = int(config_loader.get_env_variable("ELK_BATCH_SIZE", 50))
+ELK_FLUSH_INTERVAL = float(config_loader.get_env_variable("ELK_FLUSH_INTERVAL", 0.2))
+
+# === Process-wide log queue ===
+# Every configured logger enqueues records into this queue; a single
+# QueueListener thread drains it into the real (blocking) handlers.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_listener: QueueListener | None = None
+_queue_listener_lock = threading.Lock()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop DEBUG/INFO records repeating the same (service, log_type, request, msg)
+    within a time window. WARNING and above always pass. The request comes from the
+    record's ``data`` payload, falling back to the bound trace id, so identical
+    messages from different requests are all kept.
+
+    Args:
+        window (float): Dedup window in seconds.
+        max_keys (int): Upper bound of remembered keys before the cache is reset.
+    """
+
+    def __init__(self, window: float = RATE_LIMIT_WINDOW, max_keys: int = 4096):
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self._last_seen: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+
+        key = (
+            str(getattr(record, "service", "")),
+            str(getattr(record, "log_type", "")),
+            _record_request_id(record),
+            record.getMessage(),
+        )
+        now = time.monotonic()
+        with self._lock:
+            last_seen = self._last_seen.get(key)
+            if last_seen is not None and now - last_seen < self.window:
+                return False
+            if len(self._last_seen) >= self.max_keys:
+                self._last_seen.clear()
+            self._last_seen[key] = now
+        return True
+
+
+def _record_request_id(record: logging.LogRecord) -> str | None:
+    """Return the request id carried by a log record, else the current trace id."""
+    data = getattr(record, "data", None)
+    if isinstance(data, dict):
+        request_id = data.get("request_id")
+    else:
+        request_id = getattr(data, "request_id", None)
+    return request_id or trace_context.get_trace_id()
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    Only the message is rendered on enqueue; the record keeps ``exc_info`` so
+    the ECS formatter on the listener side still emits structured error fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait(record)
+
+
+class BatchingElkHandler(logging.Handler):
+    """
+    Buffer ECS-formatted records and ship them to Elasticsearch in a single
+    ``_bulk`` request once ``batch_size`` records are pending or
+    ``flush_interval`` seconds have passed since the first pending record.
+
+    Args:
+        url (str): Elasticsearch base URL.
+        index (str): Target index name.
+        batch_size (int): Number of records that triggers an immediate flush.
+        flush_interval (float): Maximum delay in seconds before a partial batch is sent.
+        timeout (float): HTTP timeout in seconds for the bulk request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        index: str,
+        batch_size: int = ELK_BATCH_SIZE,
+        flush_interval: float = ELK_FLUSH_INTERVAL,
+        timeout: float = 5.0,
+    ):
+        super().__init__()
+        self.bulk_url = f"{url.rstrip('/')}/_bulk"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._action_line = f'{{"index":{{"_index":"{index}"}}}}\n'
+        self._buffer: collections.deque[str] = collections.deque()
+        self._timer: threading.Timer | None = None
+        # Keep-alive connection pool reused by every bulk request
+        self._client = httpx.Client(timeout=timeout)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self.lock:
+            self._buffer.append(document)
+            if len(self._buffer) >= self.batch_size:
+                self._send(self._drain())
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            batch = self._drain()
+            if batch:
+                self._send(batch)
+
+    def close(self) -> None:
+        # The HTTP client is kept open: dictConfig closes every known handler
+        # on each reconfiguration while the listener keeps using this one.
+        self.flush()
+        super().close()
+
+    def _drain(self) -> list[str]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = list(self._buffer)
+        self._buffer.clear()
+        return batch
+
+    def _send(self, batch: list[str]) -> None:
+        body = "".join(f"{self._action_line}{document}\n" for document in batch)
+        try:
+            response = self._client.post(
+                self.bulk_url,
+                content=body.encode("utf-8"),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            sys.stderr.write(f"Failed to ship {len(batch)} log records to ELK: {e}\n")
+
+
+def _build_sink_handlers() -> list[logging.Handler]:
+    """Build the blocking handlers drained by the queue listener."""
+    formatter = ecs_logging.StdlibFormatter(exclude_fields=EXCLUDED_FIELDS)
+
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    console.setFormatter(formatter)
+    handlers: list[logging.Handler] = [console]
+
+    if ELK_URL:
+        elk = BatchingElkHandler(url=ELK_URL, index=ELK_INDEX)
+        elk.setLevel(logging.INFO)
+        elk.setFormatter(formatter)
+        handlers.append(elk)
+
+    return handlers
+
+
+def _start_queue_listener() -> None:
+    """Start the process-wide QueueListener once per process."""
+    global _queue_listener
+    with _queue_listener_lock:
+        if _queue_listener is not None:
+            return
+        _queue_listener = QueueListener(
+            _log_queue, *_build_sink_handlers(), respect_handler_level=True
+        )
+        _queue_listener.start()
+
+
+def stop_queue_listener() -> None:
+    """
+    Stop the current process's QueueListener, draining pending records and
+    flushing its handlers (e.g. the pending ELK batch).
+
+    Registered with ``atexit``; prefork children leave via ``os._exit`` and
+    must call it from their own shutdown hook.
+    """
+    global _queue_listener
+    with _queue_listener_lock:
+        listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        # Same guard as logging.shutdown: the stream may already be closed at exit
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _restart_queue_listener_in_child() -> None:
+    """
+    Replace the listener in a forked child (e.g. a Celery prefork worker).
+
+    Only the forking thread survives ``fork()``, so the inherited listener and
+    the ELK flush timer are dead. Fresh sink handlers are built so the child
+    does not share the parent's HTTP connection pool or pending batch.
+    """
+    global _queue_listener, _queue_listener_lock
+    _queue_listener_lock = threading.Lock()
+    if _queue_listener is None:
+        return
+    _queue_listener = None
+    _start_queue_listener()
+
+
+atexit.register(stop_queue_listener)
+os.register_at_fork(after_in_child=_restart_queue_listener_in_child)
+
+
+def _queue_handler_factory() -> QueueHandler:
+    """dictConfig factory returning a non-blocking handler bound to the shared queue."""
+    _start_queue_listener()
+    return LocalQueueHandler(_log_queue)
+
 
 def logging_config(logger: str) -> None:
     """
-    Configure a logger with console and file handlers.
+    Configure a logger with a non-blocking queue handler.
 
-    Sets up a logger with colored console output and file logging in a temporary directory.
+    Log calls only enqueue the record; a process-wide QueueListener thread
+    formats it as ECS JSON and writes it to the console (and to ELK in
+    batches when ELK_URL is set). Repeated DEBUG/INFO
+    records are rate-limited by RateLimitFilter.
 
     Args:
         logger (str): Name of the logger to configure.
@@ -37,29 +295,28 @@ def logging_config(logger: str) -> None:
         {
             "version": 1,
             "disable_existing_loggers": False,
-            "formatters": {
-                "ecs": {
-                    "()": "ecs_logging.StdlibFormatter",
-                    "exclude_fields": EXCLUDED_FIELDS,
+            "filters": {
+                "rate_limit": {
+                    "()": RateLimitFilter,
+                    "window": RATE_LIMIT_WINDOW,
                 },
             },
             "handlers": {
-                "console": {
-                    "level": "INFO",
-                    "class": "logging.StreamHandler",
-                    "formatter": "ecs",
+                "queue": {
+                    "()": _queue_handler_factory,
+                    "filters": ["rate_limit"],
                 }
             },
             "loggers": {
                 f"{logger}": {
                     "level": LOG_LEVEL,
-                    "handlers": ["console"],
+                    "handlers": ["queue"],
                     "propagate": False,
                 },
             },
             "root": {
                 "level": LOG_LEVEL,
-                "handlers": ["console"],
+                "handlers": ["queue"],
             },
         }
     )
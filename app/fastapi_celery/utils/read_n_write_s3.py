@@ -1,12 +1,17 @@
+import gzip
 import io
-import json
 import logging
-from pathlib import PurePosixPath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
 
+import orjson
 from botocore.exceptions import BotoCoreError, ClientError
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
 from utils import log_helper
+from utils.trace_context import TTLCache
 from connections import aws_connection
 from models.tracking_models import ServiceLog, LogType
 
@@ -19,50 +24,157 @@ base_logger = logging.getLogger(logger_name)
 # Wrap the base logger with the adapter
 logger = log_helper.ValidatingLoggerAdapter(base_logger, {})
 
+# Constant parts of the log "extra" payload; copied per call, never mutated
+_LOG_EXTRA_TASK = {"service": ServiceLog.FILE_STORAGE, "log_type": LogType.TASK}
+_LOG_EXTRA_ERROR = {"service": ServiceLog.FILE_STORAGE, "log_type": LogType.ERROR}
+
 _s3_connectors = {}
+_s3_connectors_lock = threading.Lock()
+
+
+def get_connector(bucket_name: str) -> aws_connection.S3Connector:
+    """
+    Return the cached connector for a bucket. The bucket is checked once per process,
+    and all connectors share the same underlying S3 client.
+    """
+    connector = _s3_connectors.get(bucket_name)
+    if connector is not None:
+        return connector
+    with _s3_connectors_lock:
+        connector = _s3_connectors.get(bucket_name)
+        if connector is None:
+            connector = aws_connection.S3Connector(bucket_name=bucket_name)
+            _s3_connectors[bucket_name] = connector
+        return connector
+
+
+# JSON outputs are stored gzip-compressed; level 1 keeps compression cheap
+GZIP_MAGIC = b"\x1f\x8b"
+JSON_GZIP_UPLOAD_ARGS = {"ContentType": "application/json", "ContentEncoding": "gzip"}
+
+# Buffers below boto3's default multipart threshold are uploaded with a single PutObject
+SINGLE_PUT_MAX_BYTES = 8 * 1024 * 1024
+
+# Recent HEAD results per (bucket, key); writes through this module invalidate their key
+_head_cache = TTLCache(maxsize=10_000, ttl=30)
+
 
+def invalidate(bucket_name: str, object_name: str) -> None:
+    """Drop the cached existence check for an object, e.g. after writing it elsewhere."""
+    _head_cache.pop((bucket_name, object_name))
 
-def put_object(client, bucket_name: str, object_name: str, uploading_data) -> dict:
-    """Upload data (buffer or file path) to S3."""
+
+def put_object(
+    client, bucket_name: str, object_name: str, uploading_data, extra_args: dict | None = None
+) -> dict:
+    """Upload data (bytes, buffer or file path) to S3."""
     try:
-        if isinstance(uploading_data, (io.BytesIO, io.StringIO)):
-            uploading_data.seek(0)
-            client.upload_fileobj(uploading_data, Bucket=bucket_name, Key=object_name)
+        if isinstance(uploading_data, (bytes, bytearray, memoryview)):
+            client.put_object(
+                Bucket=bucket_name, Key=object_name, Body=uploading_data, **(extra_args or {})
+            )
+        elif (
+            isinstance(uploading_data, io.BytesIO)
+            and uploading_data.getbuffer().nbytes < SINGLE_PUT_MAX_BYTES
+        ):
+            # Small buffers skip the transfer manager and its thread pool
+            client.put_object(
+                Bucket=bucket_name, Key=object_name, Body=uploading_data.getvalue(), **(extra_args or {})
+            )
+        elif isinstance(uploading_data, (io.BytesIO, io.StringIO)):
+            # Buffers are uploaded from the start; callers need not rewind them
+            if uploading_data.tell():
+                uploading_data.seek(0)
+            client.upload_fileobj(uploading_data, Bucket=bucket_name, Key=object_name, ExtraArgs=extra_args)
         elif isinstance(uploading_data, str):
-            client.upload_file(Filename=uploading_data, Bucket=bucket_name, Key=object_name)
+            client.upload_file(
+                Filename=uploading_data, Bucket=bucket_name, Key=object_name, ExtraArgs=extra_args
+            )
         else:
             return {
                 "status": "Failed",
                 "error": "uploading data must be buffer or file path",
             }
+        invalidate(bucket_name, object_name)
         return {"status": "Success"}
     except (ClientError, BotoCoreError, TypeError) as e:
         return {"status": "Failed", "error": str(e)}
 
 
+def get_object_bytes(client, bucket_name: str, object_name: str) -> bytes | None:
+    """Download an object from S3 as raw bytes."""
+    try:
+        response = client.get_object(Bucket=bucket_name, Key=object_name)
+        return response["Body"].read()
+    except (ClientError, BotoCoreError):
+        return None
+
+
 def get_object(client, bucket_name: str, object_name: str) -> io.BytesIO | None:
     """Download an object from S3 into BytesIO buffer."""
+    data = get_object_bytes(client, bucket_name, object_name)
+    return io.BytesIO(data) if data is not None else None
+
+
+def read_large_object_parallel(
+    client,
+    bucket_name: str,
+    object_name: str,
+    part_size: int = 8 * 1024 * 1024,
+    max_workers: int = 8,
+) -> bytearray | None:
+    """
+    Download a large object with parallel byte-range GETs into one preallocated buffer.
+    Objects no larger than `part_size` are fetched with a single GET.
+
+    The size comes from a fresh HEAD (not the HEAD cache) and every range is pinned
+    to its ETag, so an object overwritten mid-download yields None instead of a mix
+    of two versions.
+    """
     try:
-        response = client.get_object(Bucket=bucket_name, Key=object_name)
-        data = response["Body"].read()
-        buffer = io.BytesIO(data)
-        return buffer
+        head = client.head_object(Bucket=bucket_name, Key=object_name)
     except (ClientError, BotoCoreError):
         return None
+    size = head["ContentLength"]
+    if size <= part_size:
+        data = get_object_bytes(client, bucket_name, object_name)
+        return bytearray(data) if data is not None else None
+
+    buffer = bytearray(size)
+    etag = head["ETag"]
+
+    def fetch(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        response = client.get_object(
+            Bucket=bucket_name, Key=object_name, Range=f"bytes={start}-{end}", IfMatch=etag
+        )
+        data = response["Body"].read()
+        if len(data) != end - start + 1:
+            raise ValueError(f"Short read for bytes {start}-{end} of '{object_name}'")
+        buffer[start:end + 1] = data
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch, range(0, size, part_size)))
+    except (ClientError, BotoCoreError, ValueError):
+        return None
+    return buffer
 
 
 def copy_object_between_buckets(
     source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
 ) -> dict:
-    """Copy object between S3 buckets."""
+    """Copy object between S3 buckets, using parallel multipart copies for large objects."""
     try:
-        logger.info(f"Copying {source_bucket}/{source_key} → {dest_bucket}/{dest_key}")
-        client = aws_connection.S3Connector(bucket_name=source_bucket).client
-        client.copy_object(
+        logger.info("Copying %s/%s → %s/%s", source_bucket, source_key, dest_bucket, dest_key)
+        client = get_connector(source_bucket).client
+        client.copy(
             CopySource={"Bucket": source_bucket, "Key": source_key},
             Bucket=dest_bucket,
             Key=dest_key,
+            Config=aws_connection.S3_COPY_TRANSFER_CONFIG,
         )
+        invalidate(dest_bucket, dest_key)
         return {
             "status": "Success",
             "source": {"bucket": source_bucket, "key": source_key},
@@ -77,35 +189,89 @@ def copy_object_between_buckets(
         }
 
 
+def copy_objects_between_buckets(
+    pairs: list[tuple[str, str, str, str]], max_workers: int = 32
+) -> list[dict]:
+    """
+    Copy many objects concurrently. Each pair is (source_bucket, source_key, dest_bucket, dest_key);
+    results are returned in the same order as `pairs`.
+    """
+    if not pairs:
+        return []
+    # Resolve connectors up front so worker threads only reuse the shared client
+    for source_bucket in {pair[0] for pair in pairs}:
+        get_connector(source_bucket)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        return list(executor.map(lambda pair: copy_object_between_buckets(*pair), pairs))
+
+
 def object_exists(
     client, bucket_name: str, object_name: str
 ) -> tuple[bool, dict | None]:
-    """Check if object exists and return metadata."""
+    """Check if object exists and return metadata. Results are cached briefly per (bucket, key)."""
+    cache_key = (bucket_name, object_name)
+    cached = _head_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         response = client.head_object(Bucket=bucket_name, Key=object_name)
-        return True, response
+        result = (True, response)
     except ClientError as e:
-        if e.response["Error"]["Code"] == "404":
+        if e.response["Error"]["Code"] != "404":
+            # Only definitive answers are cached; other errors are retried next time
             return False, None
-        return False, None
+        result = (False, None)
+    _head_cache.set(cache_key, result)
+    return result
 
 
 def any_json_in_s3_prefix(bucket_name: str, s3_key_prefix: str) -> bool:
     """Check if any .json file exists under the given prefix."""
-    if bucket_name not in _s3_connectors:
-        _s3_connectors[bucket_name] = aws_connection.S3Connector(bucket_name=bucket_name)
-    client = _s3_connectors[bucket_name].client
+    client = get_connector(bucket_name).client
+
+    # A prefix naming a .json key only needs the first matching object
+    if s3_key_prefix.endswith(".json"):
+        response = client.list_objects_v2(Bucket=bucket_name, Prefix=s3_key_prefix, MaxKeys=1)
+        contents = response.get("Contents", [])
+        if contents and contents[0]["Key"].endswith(".json"):
+            return True
+
+    # Small pages so the common case (a .json near the start) stops after one short request
     paginator = client.get_paginator("list_objects_v2")
-    page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=s3_key_prefix)
+    page_iterator = paginator.paginate(
+        Bucket=bucket_name, Prefix=s3_key_prefix, PaginationConfig={"PageSize": 100}
+    )
 
     for page in page_iterator:
-        for obj in page.get("Contents", []):
-            key = obj["Key"]
-            if key.endswith(".json"):
+        for obj in page.get("Contents", ()):
+            # Fixed-length suffix compare, cheaper than a method call per key
+            if obj["Key"][-5:] == ".json":
                 return True
     return False
 
 
+def _serialize_json(json_data) -> bytes:
+    """
+    Serialize a payload to JSON bytes. For pydantic models the `.output` attribute is
+    written when set; models are serialized by pydantic in a single pass, falling back
+    to a dict dump + orjson when they hold values pydantic cannot serialize (e.g. numpy).
+    """
+    if isinstance(json_data, BaseModel):
+        output_attr = getattr(json_data, "output", None)
+        if output_attr is not None:
+            json_data = output_attr
+    if isinstance(json_data, BaseModel):
+        try:
+            return json_data.model_dump_json().encode("utf-8")
+        except PydanticSerializationError:
+            json_data = json_data.model_dump()
+    return orjson.dumps(
+        json_data,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+
 def write_json_to_s3(
     json_data,
     bucket_name: str,
@@ -115,40 +281,22 @@ def write_json_to_s3(
     Write JSON data to an S3 bucket.
     """
     # Prepare S3 connector
-    if bucket_name not in _s3_connectors:
-        _s3_connectors[bucket_name] = aws_connection.S3Connector(bucket_name=bucket_name)
-    s3_connector = _s3_connectors[bucket_name]
+    s3_connector = get_connector(bucket_name)
     client, bucket = s3_connector.client, s3_connector.bucket_name
 
     try:
-        # Determine payload preserving .output logic
-        if isinstance(json_data, BaseModel):
-            output_attr = getattr(json_data, "output", None)
-            if output_attr is not None:
-                payload = (
-                    output_attr.model_dump()
-                    if isinstance(output_attr, BaseModel)
-                    else output_attr
-                )
-            else:
-                payload = json_data.model_dump()
-        else:
-            payload = json_data
-
-        buffer = io.BytesIO(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
-        buffer.seek(0)
+        body = gzip.compress(_serialize_json(json_data), compresslevel=1)
 
-        upload_result = put_object(client, bucket, s3_key_prefix, buffer)
+        upload_result = put_object(
+            client, bucket, s3_key_prefix, body, extra_args=JSON_GZIP_UPLOAD_ARGS
+        )
         if upload_result.get("status") == "Failed":
             logger.error(
-                f"Failed to upload object to S3: bucket={bucket} object={s3_key_prefix} error={upload_result.get('error')}",
-                extra={
-                    "service": ServiceLog.FILE_STORAGE,
-                    "log_type": LogType.ERROR,
-                    "data": {
-                        "s3_key_prefix": s3_key_prefix
-                    },
-                },
+                "Failed to upload object to S3: bucket=%s object=%s error=%s",
+                bucket,
+                s3_key_prefix,
+                upload_result.get("error"),
+                extra={**_LOG_EXTRA_ERROR, "data": {"s3_key_prefix": s3_key_prefix}},
             )
             return {
                 "status": "Failed",
@@ -156,16 +304,13 @@ def write_json_to_s3(
                 "s3_key_prefix": s3_key_prefix,
             }
 
-        logger.info(
-            f"Uploaded JSON to S3: s3://{bucket}/{s3_key_prefix}",
-            extra={
-                "service": ServiceLog.FILE_STORAGE,
-                "log_type": LogType.TASK,
-                "data": {
-                    "s3_key_prefix": s3_key_prefix
-                },
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Uploaded JSON to S3: s3://%s/%s",
+                bucket,
+                s3_key_prefix,
+                extra={**_LOG_EXTRA_TASK, "data": {"s3_key_prefix": s3_key_prefix}},
+            )
         return {
             "status": "Success",
             "error": None,
@@ -177,43 +322,98 @@ def write_json_to_s3(
         return {"status": "Failed", "error": str(e), "s3_key_prefix": s3_key_prefix}
 
 
+def write_jsons_to_s3(
+    bucket_name: str, records: list[tuple[object, str]], max_workers: int = 16
+) -> list[dict]:
+    """
+    Upload many JSON documents concurrently. Each record is (json_data, s3_key_prefix);
+    results follow the order of `records`, in the same shape as write_json_to_s3.
+    """
+    if not records:
+        return []
+    # Resolve the connector up front so worker threads only reuse the shared client
+    get_connector(bucket_name)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(records))) as executor:
+        return list(
+            executor.map(
+                lambda record: write_json_to_s3(record[0], bucket_name, record[1]), records
+            )
+        )
+
+
 def read_json_from_s3(bucket_name: str, object_name: str) -> dict | None:
     """Read and parse JSON object from S3."""
     try:
-        if bucket_name not in _s3_connectors:
-            _s3_connectors[bucket_name] = aws_connection.S3Connector(bucket_name=bucket_name)
-        client = _s3_connectors[bucket_name].client
+        client = get_connector(bucket_name).client
         # Get the object
-        buffer = get_object(client, bucket_name, object_name)
-        if not buffer:
+        content = get_object_bytes(client, bucket_name, object_name)
+        if not content:
             return None
-        # Parse JSON
-        content = buffer.read().decode("utf-8")
-        data = json.loads(content)
-        return data
+        # Parse JSON straight from bytes, transparently handling gzip-compressed outputs
+        if content[:2] == GZIP_MAGIC:
+            content = gzip.decompress(content)
+        return orjson.loads(content)
     except Exception as e:
-        logger.error(f"Failed to read JSON from S3: {e}", exc_info=True)
+        logger.error("Failed to read JSON from S3: %s", e, exc_info=True)
         return None
 
 
-def list_objects_with_prefix(bucket_name: str, prefix: str) -> list:
-    """List all object keys under a given prefix."""
+def read_jsons_from_s3(bucket_name: str, object_names: list[str], max_workers: int = 16) -> list[dict | None]:
+    """
+    Read and parse many JSON objects concurrently, overlapping the GetObject round trips.
+    Results follow the order of `object_names`; unreadable objects yield None.
+    """
+    if not object_names:
+        return []
+    # Resolve the connector up front so worker threads only reuse the shared client
+    get_connector(bucket_name)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(object_names))) as executor:
+        return list(executor.map(lambda key: read_json_from_s3(bucket_name, key), object_names))
+
+
+def iter_objects_with_prefix(bucket_name: str, prefix: str, limit: int | None = None) -> Iterator[str]:
+    """
+    Lazily yield object keys under a given prefix, up to `limit` keys if provided.
+    Pages are fetched on demand; listing stops quietly on error.
+    """
+    try:
+        client = get_connector(bucket_name).client
+        paginator = client.get_paginator("list_objects_v2")
+        pagination_config = {"MaxItems": limit} if limit else {}
+        page_iterator = paginator.paginate(
+            Bucket=bucket_name, Prefix=prefix, PaginationConfig=pagination_config
+        )
+        # Pages without "Contents" evaluate to None
+        yield from filter(None, page_iterator.search("Contents[].Key"))
+    except Exception:
+        return
+
+
+def list_objects_with_prefix(bucket_name: str, prefix: str, limit: int | None = None) -> list:
+    """List object keys under a given prefix, up to `limit` keys if provided."""
+    return list(iter_objects_with_prefix(bucket_name, prefix, limit))
+
+
+def list_common_prefixes(bucket_name: str, prefix: str) -> list:
+    """
+    List the direct sub-folders under a given prefix (e.g. "versioning/file/001/").
+
+    Uses Delimiter="/" so S3 returns one entry per folder instead of every object.
+    """
     try:
-        if bucket_name not in _s3_connectors:
-            _s3_connectors[bucket_name] = aws_connection.S3Connector(bucket_name=bucket_name)
-        client = _s3_connectors[bucket_name].client
-        keys = []
+        client = get_connector(bucket_name).client
+        folders = []
         paginator = client.get_paginator("list_objects_v2")
-        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/")
         for page in page_iterator:
-            for obj in page.get("Contents", []):
-                keys.append(obj["Key"])
-        return keys
+            for common_prefix in page.get("CommonPrefixes", []):
+                folders.append(common_prefix["Prefix"])
+        return folders
     except Exception:
         return []
 
 
-def select_latest_rerun(keys: list[str], base_filename: str) -> str | None:
+def select_latest_rerun(keys: Iterable[str], base_filename: str) -> str | None:
     """
     Select the latest rerun JSON file from an S3 key list.
     Prefer the highest rerun number, fallback to the base file if no rerun exists.
@@ -221,13 +421,21 @@ def select_latest_rerun(keys: list[str], base_filename: str) -> str | None:
     Example:
         base_filename = "DN800018251920240708123641"
     """
-    reruns = [
-        (int(k.split("_rerun_")[-1].split(".json")[0]), k)
-        for k in keys if f"{base_filename}_rerun_" in k
-    ]
-    if reruns:
-        return max(reruns, key=lambda x: x[0])[1]
+    marker = f"{base_filename}_rerun_"
+    base_json = f"{base_filename}.json"
+    best_attempt, best_key, fallback = -1, None, None
+    # Single pass: track the highest rerun and the first plain base file together
     for k in keys:
-        if f"{base_filename}.json" in k and "_rerun_" not in k:
-            return k
-    return None
+        idx = k.rfind(marker)
+        if idx >= 0:
+            tail = k[idx + len(marker):]
+            if tail.endswith(".json"):
+                try:
+                    attempt = int(tail[:-5])
+                except ValueError:
+                    continue
+                if attempt > best_attempt:
+                    best_attempt, best_key = attempt, k
+        elif fallback is None and base_json in k and "_rerun_" not in k:
+            fallback = k
+    return best_key or fallback
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import Any, Hashable
+
+# Header used to carry the trace id from the publisher to the Celery worker
+TRACE_ID_HEADER = "trace_id"
+
+_trace_id: ContextVar[str | None] = ContextVar("trace_id", default=None)
+
+
+class TTLCache:
+    """
+    Minimal thread-safe mapping whose entries expire `ttl` seconds after insertion.
+    When full, the oldest entry is evicted first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Objects shared by the steps of one workflow run, grouped per trace id
+trace_cache = TTLCache(maxsize=10_000, ttl=300)
+
+
+def get_trace_id() -> str | None:
+    """Return the trace id bound to the current context, if any."""
+    return _trace_id.get()
+
+
+def bind_trace_id(trace_id: str | None) -> Token:
+    """Bind a trace id to the current context and return the token to reset it."""
+    return _trace_id.set(trace_id)
+
+
+def reset_trace_id(token: Token) -> None:
+    """Restore the trace id that was bound before `bind_trace_id`."""
+    _trace_id.reset(token)
+
+
+def get_cached(key: Hashable) -> Any:
+    """Return the object cached under `key` for the current trace, or None."""
+    trace_id = _trace_id.get()
+    if trace_id is None:
+        return None
+    entries = trace_cache.get(trace_id)
+    return entries.get(key) if entries else None
+
+
+def set_cached(key: Hashable, value: Any) -> None:
+    """Cache `value` under `key` for the current trace; no-op outside a trace."""
+    trace_id = _trace_id.get()
+    if trace_id is None:
+        return
+    entries = trace_cache.get(trace_id)
+    if entries is None:
+        entries = {}
+        trace_cache.set(trace_id, entries)
+    entries[key] = value
+
+
+def clear_trace(trace_id: str) -> None:
+    """Drop everything cached for a finished trace."""
+    trace_cache.pop(trace_id)
@@ -0,0 +1,19 @@
+import pytest
+
+from utils import read_n_write_s3
+
+
+@pytest.fixture(autouse=True)
+def clear_s3_head_cache():
+    """object_exists caches HEAD results per key; keep them from leaking between tests."""
+    read_n_write_s3._head_cache.clear()
+    yield
+    read_n_write_s3._head_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_s3_connectors():
+    """Connectors are cached per bucket; drop them so a patched S3Connector does not outlive its test."""
+    read_n_write_s3._s3_connectors.clear()
+    yield
+    read_n_write_s3._s3_connectors.clear()
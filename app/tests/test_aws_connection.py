@@ -4,10 +4,19 @@ import logging
 import pytest
 from unittest.mock import patch, MagicMock
 from botocore.exceptions import ClientError
-from fastapi_celery.connections.aws_connection import S3Connector, AWSSecretsManager
+from fastapi_celery.connections.aws_connection import S3Connector, AWSSecretsManager, _s3_clients, get_shared_s3_client
 
 # === S3Connector Tests ===
 
+
+@pytest.fixture(autouse=True)
+def clear_s3_client_cache():
+    """Each test patches boto3.client, so drop clients cached by earlier tests."""
+    _s3_clients.clear()
+    yield
+    _s3_clients.clear()
+
+
 @patch("boto3.client")
 def test_s3connector_head_bucket_exists(mock_boto_client):
     """Test that S3Connector does not create bucket if it already exists."""
@@ -41,6 +50,28 @@ def test_s3connector_create_bucket_raises_client_error(mock_boto_client):
     with pytest.raises(ClientError):
         S3Connector(bucket_name="fail-bucket")
 
+
+@patch("boto3.client")
+def test_s3connector_reuses_client_per_region(mock_boto_client):
+    """Test that connectors in the same region share one boto3 client."""
+    first = S3Connector(bucket_name="bucket-a")
+    second = S3Connector(bucket_name="bucket-b")
+
+    assert first.client is second.client
+    mock_boto_client.assert_called_once()
+
+
+@patch("boto3.client")
+def test_get_shared_s3_client_is_thread_safe(mock_boto_client):
+    """Test that concurrent callers all get the single shared client."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: get_shared_s3_client("ap-southeast-1"), range(32)))
+
+    assert all(client is clients[0] for client in clients)
+    mock_boto_client.assert_called_once()
+
 # === AWSSecretsManager Tests ===
 
 @patch("boto3.client")
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi_celery.models.class_models import FileRecord
+from fastapi_celery.utils import bucket_helper
+
+FILE_RECORD = FileRecord(
+    file_name="customers.csv",
+    file_name_wo_ext="customers",
+    folder_name="DKSH_TW",
+    customer_foldername="CUSTOMER_A",
+    proceed_at="20240101120000",
+)
+STEP = SimpleNamespace(stepOrder="3", stepName="PARSE_FILE")
+STEP_CONFIG = SimpleNamespace(target_store_data="workflow-node-materialized")
+
+
+@patch.object(bucket_helper, "_utc_date_str", return_value="20240101")
+def test_get_s3_key_prefix_step_prefixes(mock_date):
+    full = bucket_helper.get_s3_key_prefix(
+        "req-1", FILE_RECORD, STEP, STEP_CONFIG, rerun_attempt=2, is_full_prefix=True
+    )
+    short = bucket_helper.get_s3_key_prefix("req-1", FILE_RECORD, STEP, STEP_CONFIG, is_master_data=True)
+
+    assert full == (
+        "workflow-node-materialized/DKSH_TW/CUSTOMER_A/20240101/req-1/03_PARSE_FILE/customers_rerun_2.json"
+    )
+    assert short == "workflow-node-materialized/customers/20240101/req-1/03_PARSE_FILE/"
+
+
+def test_get_s3_key_prefix_master_data_folders():
+    def build(target_folder):
+        return bucket_helper.get_s3_key_prefix(
+            "req-1", FILE_RECORD, is_master_data=True, target_folder=target_folder, version_folder="002"
+        )
+
+    assert build("master_data") == "master_data/customers/customers.csv"
+    assert build("process_data") == "process_data/customers/customers_20240101120000.json"
+    assert build("versioning") == "versioning/customers/002/customers.csv"
+    assert build("unknown") is None
+
+
+@patch.object(bucket_helper, "_utc_date_str", return_value="20240101")
+def test_get_s3_key_prefix_step_keeps_target_store_data(mock_date):
+    file_record = FileRecord(
+        file_name="customers.csv",
+        file_name_wo_ext="customers",
+        folder_name="/DKSH_TW",
+        customer_foldername=None,
+        proceed_at="20240101120000",
+    )
+
+    prefix = bucket_helper.get_s3_key_prefix("req-1", file_record, STEP, STEP_CONFIG)
+
+    assert prefix == "workflow-node-materialized//DKSH_TW/None/20240101/req-1/03_PARSE_FILE/"
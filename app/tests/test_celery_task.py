@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from celery.exceptions import Retry
 from fastapi_celery.celery_worker import celery_task
-from fastapi_celery.models.class_models import StepOutput, StatusEnum, DocumentType
+from fastapi_celery.models.class_models import StepOutput, StatusEnum, DocumentType, FileRecord
 from pydantic import BaseModel
 
 
@@ -119,10 +119,7 @@ async def test_handle_task_success(
     fake_processor = MagicMock()
     fake_processor.document_type = DocumentType.ORDER.value
     fake_processor.run.return_value = None
-    fake_processor.file_record = {
-        "file_name": "dummy.xlsx",
-        "file_extension": ".xlsx"
-    }
+    fake_processor.file_record = FileRecord(file_name="dummy.xlsx", file_extension=".xlsx")
     mock_processor.return_value = fake_processor
 
     # === Fake workflow step ===
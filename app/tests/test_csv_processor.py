@@ -4,7 +4,13 @@ import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
-from fastapi_celery.processors.file_processors.csv_processor import CSVProcessor, METADATA_SEPARATOR
+from fastapi_celery.processors.file_processors.csv_processor import (
+    CSVProcessor,
+    ENCODING_SAMPLE_BYTES,
+    METADATA_SEPARATOR,
+    decode_csv_content,
+    read_local_csv_text,
+)
 from fastapi_celery.models.tracking_models import TrackingModel
 from models.class_models import DocumentType, PODataParsed, SourceType, StatusEnum
 
@@ -45,6 +51,54 @@ def test_load_csv_rows(mock_detect, mock_tracking_model, mock_file_processor):
     mock_file_processor.assert_called_once()
 
 
+def test_load_csv_rows_skips_blank_rows_and_keeps_quoted_newlines(mock_tracking_model):
+    from fastapi_celery.processors.file_processors import csv_processor
+
+    file_object = MagicMock()
+    file_object.source_type = "s3"
+    file_object.object_buffer = io.BytesIO('名稱,備註\n\n , \n"A","line1\nline2"\n'.encode("utf-8"))
+
+    with patch.object(csv_processor.file_extraction, "get_file_processor", return_value=file_object), \
+            patch.object(csv_processor.chardet, "detect", return_value={"encoding": "utf-8"}):
+        processor = CSVProcessor(mock_tracking_model)
+
+    assert processor.rows == [["名稱", "備註"], ["A", "line1\nline2"]]
+
+
+def test_decode_csv_content_prefers_utf8_and_samples_for_detection():
+    from fastapi_celery.processors.file_processors import csv_processor
+
+    with patch.object(csv_processor.chardet, "detect") as mock_detect:
+        assert decode_csv_content("\ufeff品名,數量".encode("utf-8")) == "品名,數量"
+        mock_detect.assert_not_called()
+
+        big5 = "品名,數量\n".encode("big5") * 20000
+        mock_detect.return_value = {"encoding": "big5", "confidence": 0.99}
+        assert decode_csv_content(big5) == "品名,數量\n" * 20000
+        assert len(mock_detect.call_args.args[0]) == csv_processor.ENCODING_SAMPLE_BYTES
+
+
+def test_decode_csv_content_scans_past_an_ascii_prefix():
+    header = "PO,Customer,Qty\n".encode("ascii") * 6000
+    content = header + "台灣大昌華嘉,PO-1,1\n".encode("big5")
+
+    text = decode_csv_content(content)
+
+    assert len(header) > ENCODING_SAMPLE_BYTES
+    assert "台灣大昌華嘉" in text
+    assert "\ufffd" not in text
+
+
+def test_read_local_csv_text_maps_file(tmp_path):
+    csv_path = tmp_path / "po.csv"
+    csv_path.write_bytes("\ufeff品名,數量\nA,1\n".encode("utf-8"))
+    assert read_local_csv_text(csv_path) == "品名,數量\nA,1\n"
+
+    empty_path = tmp_path / "empty.csv"
+    empty_path.write_bytes(b"")
+    assert read_local_csv_text(empty_path) == ""
+
+
 def test_extract_metadata_found(mock_tracking_model, mock_file_processor):
     processor = CSVProcessor(mock_tracking_model)
     row = [f"Key{METADATA_SEPARATOR}Value"]
@@ -68,6 +122,40 @@ def test_is_likely_header(row, expected, mock_tracking_model, mock_file_processo
     assert processor.is_likely_header(row) == expected
 
 
+def test_is_likely_header_reuses_cached_result():
+    from fastapi_celery.processors.file_processors import csv_processor
+
+    csv_processor._is_likely_header.cache_clear()
+    processor = CSVProcessor.__new__(CSVProcessor)
+    assert processor.is_likely_header(["Item", "Qty"]) is True
+    assert processor.is_likely_header(["Item", "Qty"]) is True
+    info = csv_processor._is_likely_header.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("row,expected", [
+    (
+        ["", f" Order No {METADATA_SEPARATOR} PO-1 {METADATA_SEPARATOR} x "],
+        {"Order No": f"PO-1 {METADATA_SEPARATOR} x"},
+    ),
+    ([f"Empty{METADATA_SEPARATOR}"], {"Empty": ""}),
+    (["no", "separator"], {}),
+])
+def test_extract_metadata_splits_on_first_separator(row, expected):
+    processor = CSVProcessor.__new__(CSVProcessor)
+    assert processor.extract_metadata(row) == expected
+
+
+@pytest.mark.parametrize("row,expected", [
+    (["Item", "Qty", "1.5", "Unit", "Price", "Amount", "Note", "Date", "", "10"], True),
+    (["Item", "1", "2.5", ""], False),
+    ([], True),
+])
+def test_is_likely_header_threshold(row, expected):
+    processor = CSVProcessor.__new__(CSVProcessor)
+    assert processor.is_likely_header(row) == expected
+
+
 def test_parse_metadata_rows(mock_tracking_model, mock_file_processor):
     processor = CSVProcessor(mock_tracking_model)
     processor.rows = [
@@ -1,7 +1,7 @@
 import os
 import pytest
 import pandas as pd
-from fastapi_celery.processors.helpers.excel_helper import ExcelHelper
+from fastapi_celery.processors.helpers.excel_helper import ExcelHelper, _read_xlsx_rows, _NA_STRINGS
 from fastapi_celery.models.class_models import SourceType
 
 # ==============================
@@ -56,6 +56,34 @@ def test_read_rows_xls(tracking_model_xls):
     assert helper.capacity is not None
 
 
+def test_na_strings_match_pandas_defaults():
+    from pandas._libs.parsers import STR_NA_VALUES
+
+    assert _NA_STRINGS == STR_NA_VALUES
+
+
+def test_read_xlsx_rows_matches_pandas(tmp_path):
+    """Read-only openpyxl rows match pd.read_excel(dtype=str) output"""
+    import datetime
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["PO", 1, 1.5, None, "N/A"])
+    sheet.append([None, None])
+    sheet.append([datetime.datetime(2024, 1, 2, 3, 4, 5), None, 2.0, 1e20, "x"])
+    sheet.append([None])
+    workbook.create_sheet("second")["C3"] = "z"
+    path = tmp_path / "sample.xlsx"
+    workbook.save(path)
+
+    expected = []
+    for sheet_df in pd.read_excel(path, sheet_name=None, header=None, dtype=str, engine="openpyxl").values():
+        expected.extend(sheet_df.fillna("").astype(str).values.tolist())
+
+    assert _read_xlsx_rows(path) == expected
+
+
 # ==============================
 # Tests extract_metadata
 # ==============================
@@ -74,12 +102,37 @@ def test_extract_inner_metadata(tracking_model_xlsx):
     assert metadata["header"] == "Header(Version：2.1)"
     assert metadata["Version"] == "2.1"
 
+
+def test_inner_metadata_patterns_follow_separator():
+    helper = ExcelHelper.__new__(ExcelHelper)
+    helper.separator = "："
+    assert helper._has_inner_metadata("Title(Version：1.0)")
+
+    helper.separator = "="
+    metadata = {}
+    assert not helper._has_inner_metadata("Title(Version：1.0)")
+    helper._extract_inner_metadata("Header(Rev=2)", metadata)
+    assert metadata == {"header": "Header(Rev=2)", "Rev": "2"}
+
+
 def test_is_url(tracking_model_xlsx):
     helper = ExcelHelper(tracking_model_xlsx, SourceType.LOCAL)
     helper.separator = "："
     assert helper._is_url("https://example.com")
     assert not helper._is_url("not_a_url")
 
+
+@pytest.mark.parametrize("value,expected", [
+    ("https://example.com", True),
+    ("HTTP://EXAMPLE.COM", True),
+    ("ftp://example.com", False),
+    ("htt", False),
+    (None, False),
+])
+def test_is_url_prefix(value, expected):
+    assert ExcelHelper._is_url(ExcelHelper.__new__(ExcelHelper), value) is expected
+
+
 def test_extract_standard_metadata(tracking_model_xlsx):
     helper = ExcelHelper(tracking_model_xlsx, SourceType.LOCAL)
     helper.separator = "："
@@ -136,3 +136,37 @@ def test_logger_exists(processor):
     from fastapi_celery.processors.file_processors import excel_processor
     assert hasattr(excel_processor, "logger")
     assert excel_processor.logger is not None
+
+
+def test_parse_classifies_each_row_once(processor):
+    processor.rows = [
+        ["Header1", "Header2", "Header3"],
+        ["x1", "y1"],
+        ["Info：short-row"],
+        ["H2-1", "H2-2"],
+        ["x2", "y2"],
+    ]
+    seen = []
+
+    def fake_extract_metadata(row):
+        seen.append(row[0])
+        return {"Info": "short-row"} if "Info" in row[0] else {}
+
+    processor.extract_metadata = fake_extract_metadata
+
+    result = processor.parse_file_to_json()
+
+    assert seen == [row[0] for row in processor.rows]
+    assert result.metadata == {"Info": "short-row"}
+    assert result.items == [{"H2-1": "x2", "H2-2": "y2"}]
+
+
+def test_parse_result_keeps_field_types(processor):
+    processor.tracking_model.file_path = "/fake/path/dummy.xlsx"
+    processor.rows = [["Item", "Qty"], ["Pen", "10"]]
+    processor.extract_metadata = lambda row: {}
+
+    result = processor.parse_file_to_json()
+
+    assert isinstance(result.original_file_path, Path)
+    assert result.original_file_path == Path("/fake/path/dummy.xlsx")
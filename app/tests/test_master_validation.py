@@ -1,14 +1,35 @@
 import pytest
 import types
+from types import MappingProxyType
 import pandas as pd
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, Mock
 
+from fastapi_celery.processors.workflow_processors import master_validation as master_validation_module
 from fastapi_celery.processors.workflow_processors.master_validation import (
     MasterValidation,
     masterdata_header_validation,
     masterdata_data_validation,
 )
-from fastapi_celery.models.class_models import MasterDataParsed, StatusEnum, StepOutput
+from fastapi_celery.models.class_models import FileRecord, MasterDataParsed, StatusEnum, StepOutput
+
+
+# Read-only reference schemas shared by the success cases; validation must not mutate them
+_HEADER_REF = tuple(
+    MappingProxyType(ref)
+    for ref in (
+        {"name": "ID", "posidx": 0},
+        {"name": "Name", "posidx": 1},
+        {"name": "Date", "posidx": 2},
+    )
+)
+_DATA_REF = tuple(
+    MappingProxyType(ref)
+    for ref in (
+        {"name": "ID", "datatype": "int", "nullable": False},
+        {"name": "Name", "datatype": "string", "nullable": False, "maxlength": 10},
+        {"name": "Date", "datatype": "timestamp", "nullable": False},
+    )
+)
 
 
 # ====== Fixtures ======
@@ -25,8 +46,9 @@ def fake_tracking_model():
     return FakeTrackingModel
 
 
-@pytest.fixture
-def masterdata_json():
+@pytest.fixture(scope="module")
+def masterdata_json_template():
+    """Validated once per module; tests get their own copy through masterdata_json."""
     data = {
         "ID": ["1", "2"],
         "Name": ["Alice", "Bob"],
@@ -44,6 +66,12 @@ def masterdata_json():
     )
 
 
+@pytest.fixture
+def masterdata_json(masterdata_json_template):
+    # Deep copy: some tests mutate items in place
+    return masterdata_json_template.model_copy(deep=True)
+
+
 @pytest.fixture
 def master_validation(masterdata_json, fake_tracking_model):
     tracking_model = fake_tracking_model("tests/samples/0808fake_xlsx.xlsx")
@@ -54,12 +82,7 @@ def master_validation(masterdata_json, fake_tracking_model):
 # ====== Header validation tests ======
 
 def test_header_validation_success(master_validation):
-    header_ref = [
-        {"name": "ID", "posidx": 0},
-        {"name": "Name", "posidx": 1},
-        {"name": "Date", "posidx": 2},
-    ]
-    result = master_validation.header_validation(header_ref)
+    result = master_validation.header_validation(_HEADER_REF)
     assert result.step_status == StatusEnum.SUCCESS
     assert result.messages is None
 
@@ -75,15 +98,20 @@ def test_header_validation_fail(master_validation):
     assert any("Mismatch at position" in m for m in result.messages)
 
 
+def test_header_validation_length_mismatch(master_validation):
+    header_ref = [
+        {"name": "Name", "posidx": 1},
+        {"name": "ID", "posidx": 0},
+    ]
+    result = master_validation.header_validation(header_ref)
+    assert result.step_status == StatusEnum.FAILED
+    assert result.messages == ["Length mismatch: schema has 2 fields, headers have 3"]
+
+
 # ====== Data validation tests ======
 
 def test_data_validation_success(master_validation):
-    data_ref = [
-        {"name": "ID", "datatype": "int", "nullable": False},
-        {"name": "Name", "datatype": "string", "nullable": False, "maxlength": 10},
-        {"name": "Date", "datatype": "timestamp", "nullable": False},
-    ]
-    result = master_validation.data_validation(data_ref)
+    result = master_validation.data_validation(_DATA_REF)
     assert result.step_status == StatusEnum.SUCCESS
 
 
@@ -105,129 +133,91 @@ def test_data_validation_invalid_type(master_validation):
     assert "invalid value" in result.messages[0]
 
 
-# ====== Async masterdata header/data validation ======
-
-class DummySelf:
-    file_record = {"file_name": "dummy.txt"}
-    tracking_model = types.SimpleNamespace(file_path="dummy_path")
-
+def test_data_validation_timestamp_reports_first_bad_row(master_validation):
+    # 99991231 is outside pandas' ns range but still a valid date
+    master_validation.masterdata["Date"] = ["99991231", "20251301"]
+    result = master_validation.data_validation([{"name": "Date", "datatype": "timestamp"}])
+    assert result.step_status == StatusEnum.FAILED
+    assert result.messages[-1].startswith("Row 1: Field 'Date' has invalid value '20251301'")
 
-@pytest.mark.asyncio
-async def test_masterdata_header_validation_success(masterdata_json):
-    input_data = StepOutput(
-        output=masterdata_json,
-        step_status=StatusEnum.SUCCESS,
-        step_failure_message=None,
-    )
-    dummy_self = DummySelf()
-
-    async_mock = AsyncMock(
-        return_value=[
-            {"name": "ID", "posidx": 0},
-            {"name": "Name", "posidx": 1},
-            {"name": "Date", "posidx": 2},
-        ]
-    )
 
-    with patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.BEConnector"
-    ) as mock_conn, patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.MasterValidation"
-    ) as mock_mv:
-        mock_conn.return_value.get = async_mock
-        instance = mock_mv.return_value
-        instance.header_validation.return_value = masterdata_json
+def test_invalid_date_mask_rejects_pandas_keywords(master_validation):
+    values = pd.Series(["20250101", "now", "today", "NOW", "Today", "99991231"])
+    mask = master_validation._invalid_date_mask(values, "%Y%m%d")
+    assert mask.tolist() == [False, True, True, True, True, False]
 
-        result = await masterdata_header_validation(dummy_self, input_data)
-        assert result.step_status == StatusEnum.SUCCESS
 
+def test_invalid_int_mask_matches_integer_pattern(master_validation):
+    values = pd.Series(["12", "-7", "x", "", "-", "--1", "1.5", "١٢", "²"])
+    mask = master_validation._invalid_int_mask(values)
+    assert mask.tolist() == (~values.str.fullmatch(r"-?\d+")).tolist()
 
-@pytest.mark.asyncio
-async def test_masterdata_header_validation_fail(masterdata_json):
-    input_data = StepOutput(
-        output=masterdata_json,
-        step_status=StatusEnum.SUCCESS,
-        step_failure_message=None,
-    )
-    dummy_self = DummySelf()
-
-    async_mock = AsyncMock(
-        return_value=[
-            {"name": "ID", "posidx": 0},
-            {"name": "FullName", "posidx": 1},
-            {"name": "Date", "posidx": 2},
-        ]
-    )
 
-    with patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.BEConnector"
-    ) as mock_conn, patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.MasterValidation"
-    ) as mock_mv:
-        mock_conn.return_value.get = async_mock
-        instance = mock_mv.return_value
-        instance.header_validation.return_value = masterdata_json.model_copy(
-            update={"step_status": StatusEnum.FAILED}
-        )
-
-        result = await masterdata_header_validation(dummy_self, input_data)
-        assert result.step_status == StatusEnum.FAILED
-
-
-@pytest.mark.asyncio
-async def test_masterdata_data_validation_success(masterdata_json):
-    input_data = StepOutput(
-        output=masterdata_json,
-        step_status=StatusEnum.SUCCESS,
-        step_failure_message=None,
-    )
-    dummy_self = DummySelf()
-
-    async_mock = AsyncMock(
-        return_value=[
-            {"name": "ID", "datatype": "int", "nullable": False},
-            {"name": "Name", "datatype": "string", "nullable": False, "maxlength": 10},
-            {"name": "Date", "datatype": "timestamp", "nullable": False},
-        ]
-    )
-
-    with patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.BEConnector"
-    ) as mock_conn, patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.MasterValidation"
-    ) as mock_mv:
-        mock_conn.return_value.get = async_mock
-        instance = mock_mv.return_value
-        instance.data_validation.return_value = masterdata_json
+# ====== Async masterdata header/data validation ======
 
-        result = await masterdata_data_validation(dummy_self, input_data)
-        assert result.step_status == StatusEnum.SUCCESS
+class DummySelf:
+    file_record = FileRecord(file_name="dummy.txt")
+    tracking_model = types.SimpleNamespace(file_path="dummy_path")
 
 
-@pytest.mark.asyncio
-async def test_masterdata_data_validation_fail(masterdata_json):
-    masterdata_json.items["ID"] = ["1", "x"]
+@pytest.fixture
+def patched_masterdata(monkeypatch, request):
+    """Patch BEConnector to return request.param and MasterValidation with a mock."""
+    connector = Mock()
+    connector.get = AsyncMock(return_value=request.param)
+    mock_mv = Mock()
+    monkeypatch.setattr(master_validation_module, "BEConnector", Mock(return_value=connector))
+    monkeypatch.setattr(master_validation_module, "MasterValidation", mock_mv)
+    return types.SimpleNamespace(validator=mock_mv.return_value, reference=request.param)
+
+
+@pytest.mark.parametrize(
+    "step,validator,patched_masterdata,status",
+    [
+        pytest.param(
+            masterdata_header_validation,
+            "header_validation",
+            _HEADER_REF,
+            StatusEnum.SUCCESS,
+            id="header_success",
+        ),
+        pytest.param(
+            masterdata_header_validation,
+            "header_validation",
+            [
+                {"name": "ID", "posidx": 0},
+                {"name": "FullName", "posidx": 1},
+                {"name": "Date", "posidx": 2},
+            ],
+            StatusEnum.FAILED,
+            id="header_fail",
+        ),
+        pytest.param(
+            masterdata_data_validation,
+            "data_validation",
+            _DATA_REF,
+            StatusEnum.SUCCESS,
+            id="data_success",
+        ),
+        pytest.param(
+            masterdata_data_validation,
+            "data_validation",
+            [{"name": "ID", "datatype": "int", "nullable": False}],
+            StatusEnum.FAILED,
+            id="data_fail",
+        ),
+    ],
+    indirect=["patched_masterdata"],
+)
+async def test_masterdata_validation_steps(step, validator, patched_masterdata, status, masterdata_json):
     input_data = StepOutput(
         output=masterdata_json,
         step_status=StatusEnum.SUCCESS,
         step_failure_message=None,
     )
-    dummy_self = DummySelf()
-
-    async_mock = AsyncMock(
-        return_value=[{"name": "ID", "datatype": "int", "nullable": False}]
-    )
+    validate = getattr(patched_masterdata.validator, validator)
+    validate.return_value = masterdata_json.model_copy(update={"step_status": status})
 
-    with patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.BEConnector"
-    ) as mock_conn, patch(
-        "fastapi_celery.processors.workflow_processors.master_validation.MasterValidation"
-    ) as mock_mv:
-        mock_conn.return_value.get = async_mock
-        instance = mock_mv.return_value
-        instance.data_validation.return_value = masterdata_json.model_copy(
-            update={"step_status": StatusEnum.FAILED}
-        )
-
-        result = await masterdata_data_validation(dummy_self, input_data)
-        assert result.step_status == StatusEnum.FAILED
+    result = await step(DummySelf(), input_data)
+    assert result.step_status == status
+    assert list(validate.call_args.kwargs.values()) == [patched_masterdata.reference]
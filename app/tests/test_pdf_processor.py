@@ -2,6 +2,7 @@
 import io
 import re
 import types
+from dataclasses import dataclass, field
 import pytest
 from unittest.mock import Mock, patch
 
@@ -17,25 +18,26 @@ class MockFitzPage:
 
 class MockFitzDoc:
     def __init__(self, pages_texts):
-        self._pages = [MockFitzPage(t) for t in pages_texts]
+        self._texts = list(pages_texts)
 
     def __iter__(self):
-        return iter(self._pages)
+        # Pages are built as the parser walks the document, like fitz does
+        return (MockFitzPage(t) for t in self._texts)
 
     def close(self):
         pass
 
+@dataclass(slots=True)
 class MockPdfPlumberPage:
-    def __init__(self, text=None, tables=None):
-        self._text = text
-        self._tables = tables or []
+    text: str | None = None
+    tables: list = field(default_factory=list)
 
     def extract_text(self):
-        return self._text
+        return self.text
 
     def extract_tables(self):
         # return tables as list-of-lists
-        return self._tables
+        return self.tables
 
 class MockPdfPlumber:
     def __init__(self, pages):
@@ -51,6 +53,7 @@ class MockPdfPlumber:
 class FakeFileObj:
     def __init__(self, source="local", file_path="/fake/path.pdf", buffer_bytes=b"fake"):
         self.source = source
+        self.source_type = source
         self.file_path = file_path
         self.object_buffer = io.BytesIO(buffer_bytes)
 
@@ -95,6 +98,24 @@ def fake_tracking_model():
     t.file_path = "/fake/path/file.pdf"
     return t
 
+@pytest.fixture
+def patch_pdf_io(monkeypatch, request):
+    """Patch pdfplumber.open and the file processor lookup; the param is either
+    the pages to return or the exception pdfplumber.open should raise."""
+    pages = request.param
+    if isinstance(pages, Exception):
+        def pdf_open(src):
+            raise pages
+    else:
+        def pdf_open(src):
+            return MockPdfPlumber(pages)
+    monkeypatch.setattr(pp.pdfplumber, "open", pdf_open)
+    monkeypatch.setattr(
+        pp.file_extraction,
+        "get_file_processor",
+        lambda tracking_model, source_type: FakeFileObj(source="s3"),
+    )
+
 # === Tests for Pdf001Template ===
 def test_pdf001_extract_metadata_and_tables_simple():
     tmpl = pp.Pdf001Template(tracking_model=fake_tracking_model() if False else Mock(), source=pp.SourceType.SFTP)
@@ -143,20 +164,6 @@ def test_pdf001_parse_file_to_json_failed(monkeypatch, fake_tracking_model):
     assert "fail ext" in res["error"]
 
 # === Tests for Pdf002Template ===
-def test_pdf002_extract_metadata_notes_and_tables(monkeypatch, fake_tracking_model):
-    # Prepare fake pdfplumber open to return pages with text and tables
-    pages = [
-        MockPdfPlumberPage(text="採購單號：PONUM\n時間", tables=[["請購明細單號","數量"], ["REQ1","10"]]),
-        MockPdfPlumberPage(text="更多行\n採購單號：SECOND", tables=[])
-    ]
-    monkeypatch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj(source="s3"))
-
-    res = pp.Pdf002Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert res["status"] == "success"
-    # Pdf002 sets po_number from 採購單號 or 採購單號 alternative
-    assert res["po_number"] in (None, "PONUM", "SECOND") or "items" in res
-
 def test_pdf002_extract_tables_handles_pdfplumber_error(monkeypatch):
     # make pdfplumber.open raise to exercise error path in extract_tables
     def raise_open(x):
@@ -184,15 +191,7 @@ def test_pdf004_parse_item_lines_and_build_table():
     if built:
         assert "產品編號" in built[0] and "數量" in built[0]
 
-def test_pdf004_parse_file_to_json_with_pdfplumber(monkeypatch, fake_tracking_model):
-    pages = [MockPdfPlumberPage(text="採購單號：PO444\nS1234567 品名A 2 pcs 1,000 2,000 2025-01-01 0")]
-    monkeypatch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj(source="s3"))
-    res = pp.Pdf004Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert res["status"] == "success"
-
-# === Tests for Pdf006Template ===
-def test_pdf006_parse_kv_and_notes_and_items():
+def test_pdf006_parse_kv_and_notes_and_items(monkeypatch):
     tmpl = pp.Pdf006Template(tracking_model=Mock(), source=pp.SourceType.SFTP)
     lines = [
         "訂購單號：PO006",
@@ -212,14 +211,12 @@ def test_pdf006_parse_kv_and_notes_and_items():
     assert isinstance(items, list)
     # call parse_file_to_json with pdfplumber mocked
     pages = [MockPdfPlumberPage(text="\n".join(lines))]
-    monkeypatch_patch = pytest.MonkeyPatch()
-    monkeypatch_patch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
-    monkeypatch_patch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj(source="s3"))
-    try:
-        res = tmpl.parse_file_to_json()
-        assert res["status"] == "success"
-    finally:
-        monkeypatch_patch.undo()
+    monkeypatch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
+    monkeypatch.setattr(
+        pp.file_extraction, "get_file_processor", lambda tracking_model, source_type: FakeFileObj(source="s3")
+    )
+    res = tmpl.parse_file_to_json()
+    assert res["status"] == "success"
 
 # === Tests for Pdf007Template ===
 def test_pdf007_extract_kv_and_notes_and_tables(monkeypatch, fake_tracking_model):
@@ -263,15 +260,6 @@ def test_pdf008_time_logic_and_tables():
     assert isinstance(rows, list)
     assert all("退貨單號" in r for r in rows)
 
-def test_pdf008_parse_file_to_json(monkeypatch, fake_tracking_model):
-    pages = [MockPdfPlumberPage(text="退貨單號 RET001\n1 RET001 2025-01-01 2")]
-    monkeypatch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj(source="s3"))
-    res = pp.Pdf008Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert res["status"] == "success"
-    assert "items" in res
-
-# === Edge / error conditions ===
 def test_pdf007_extract_tables_pdfplumber_error(monkeypatch):
     # ensure extract_tables returns [] on pdfplumber error
     def raise_open(x):
@@ -283,28 +271,6 @@ def test_pdf007_extract_tables_pdfplumber_error(monkeypatch):
 
 # === Additional tests to push coverage >95% ===
 
-def test_pdf002_parse_file_to_json_exception(monkeypatch, fake_tracking_model):
-    # Simulate pdfplumber raising inside parse_file_to_json
-    def raise_open(x):
-        raise ValueError("broken pdf")
-    monkeypatch.setattr(pp.pdfplumber, "open", raise_open)
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj(source="s3"))
-    result = pp.Pdf002Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert result["status"] == "failed"
-    assert "broken pdf" in result["error"]
-
-
-def test_pdf007_parse_file_to_json_exception(monkeypatch, fake_tracking_model):
-    # simulate pdfplumber.open raising unexpected exception
-    def raise_open(x):
-        raise IOError("cannot read file")
-    monkeypatch.setattr(pp.pdfplumber, "open", raise_open)
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj())
-    result = pp.Pdf007Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert result["status"] == "failed"
-    assert "cannot read file" in result["error"]
-
-
 def test_pdf001_s3_mode_uses_buffer(monkeypatch, fake_tracking_model):
     """Test Pdf001Template can handle S3 source with buffer bytes and return valid JSON result."""
     # Fake file object for S3 source
@@ -349,21 +315,55 @@ def test_pdf004_parse_item_lines_with_additional_spec():
     assert all(isinstance(i, (tuple, dict)) for i in items)
 
 
-
-def test_pdf006_no_items_returns_failed(monkeypatch, fake_tracking_model):
-    # patch pdfplumber to return pages without matching pattern
-    pages = [MockPdfPlumberPage(text="隨便內容沒有商品代碼")]
-    monkeypatch.setattr(pp.pdfplumber, "open", lambda src: MockPdfPlumber(pages))
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj())
-    result = pp.Pdf006Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert result["status"] == "failed" or result["items"] == []
-
-
-def test_pdf008_exception_during_pdfplumber(monkeypatch, fake_tracking_model):
-    # pdfplumber.open raises to trigger failed branch
-    def raise_open(x):
-        raise RuntimeError("pdf broken")
-    monkeypatch.setattr(pp.pdfplumber, "open", raise_open)
-    monkeypatch.setattr(pp.file_extraction, "FileExtensionProcessor", lambda tracking_model, source: FakeFileObj())
-    result = pp.Pdf008Template(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
-    assert result["status"] == "failed"
+@pytest.mark.parametrize(
+    "template_cls,patch_pdf_io,expected_status,expected_error",
+    [
+        pytest.param(
+            pp.Pdf002Template,
+            [
+                MockPdfPlumberPage(text="採購單號：PONUM\n時間", tables=[["請購明細單號", "數量"], ["REQ1", "10"]]),
+                MockPdfPlumberPage(text="更多行\n採購單號：SECOND", tables=[]),
+            ],
+            "success",
+            None,
+            id="pdf002_success",
+        ),
+        pytest.param(
+            pp.Pdf004Template,
+            [MockPdfPlumberPage(text="採購單號：PO444\nS1234567 品名A 2 pcs 1,000 2,000 2025-01-01 0")],
+            "success",
+            None,
+            id="pdf004_success",
+        ),
+        pytest.param(
+            pp.Pdf008Template,
+            [MockPdfPlumberPage(text="退貨單號 RET001\n1 RET001 2025-01-01 2")],
+            "success",
+            None,
+            id="pdf008_success",
+        ),
+        pytest.param(
+            pp.Pdf006Template,
+            [MockPdfPlumberPage(text="隨便內容沒有商品代碼")],
+            "success",
+            None,
+            id="pdf006_no_items",
+        ),
+        pytest.param(pp.Pdf002Template, ValueError("broken pdf"), "failed", "broken pdf", id="pdf002_error"),
+        pytest.param(pp.Pdf007Template, IOError("cannot read file"), "failed", "cannot read file", id="pdf007_error"),
+        pytest.param(pp.Pdf008Template, RuntimeError("pdf broken"), "failed", "pdf broken", id="pdf008_error"),
+    ],
+    indirect=["patch_pdf_io"],
+)
+def test_pdf_parse_file_to_json(template_cls, patch_pdf_io, expected_status, expected_error, fake_tracking_model):
+    res = template_cls(tracking_model=fake_tracking_model, source=pp.SourceType.SFTP).parse_file_to_json()
+    assert res["status"] == expected_status
+    if expected_error:
+        assert expected_error in res["error"]
+    else:
+        assert "items" in res or "error" in res
+
+
+def test_lazy_import_reuses_loaded_module():
+    assert pp._lazy_import("re") is re
+    assert callable(pp.pdfplumber.open)
@@ -1,8 +1,11 @@
+import gzip
 import io
 import json
 import unittest
 from unittest.mock import MagicMock, patch
+import boto3
 from botocore.exceptions import ClientError, BotoCoreError
+from botocore.stub import Stubber
 
 from fastapi_celery.utils import read_n_write_s3 as s3_utils
 
@@ -14,12 +17,30 @@ class TestReadWriteS3(unittest.TestCase):
         self.object_name = "test.json"
         self.client = MagicMock()
         s3_utils._s3_connectors.clear()
+        s3_utils._head_cache.clear()
 
     # === put_object ===
     def test_put_object_with_buffer_success(self):
         buf = io.BytesIO(b"data")
         result = s3_utils.put_object(self.client, self.bucket_name, self.object_name, buf)
-        self.client.upload_fileobj.assert_called_once()
+        self.client.put_object.assert_called_once_with(Bucket=self.bucket_name, Key=self.object_name, Body=b"data")
+        self.client.upload_fileobj.assert_not_called()
+        self.assertEqual(result["status"], "Success")
+
+    @patch.object(s3_utils, "SINGLE_PUT_MAX_BYTES", 4)
+    def test_put_object_rewinds_consumed_buffer(self):
+        buf = io.BytesIO(b"data")
+        buf.read()
+        s3_utils.put_object(self.client, self.bucket_name, self.object_name, buf)
+        self.assertIs(self.client.upload_fileobj.call_args.args[0], buf)
+        self.assertEqual(buf.tell(), 0)
+
+    def test_put_object_with_bytes_uses_single_put(self):
+        result = s3_utils.put_object(self.client, self.bucket_name, self.object_name, bytearray(b"data"))
+        self.client.put_object.assert_called_once_with(
+            Bucket=self.bucket_name, Key=self.object_name, Body=bytearray(b"data")
+        )
+        self.client.upload_fileobj.assert_not_called()
         self.assertEqual(result["status"], "Success")
 
     def test_put_object_with_filepath_success(self):
@@ -27,13 +48,28 @@ class TestReadWriteS3(unittest.TestCase):
         self.client.upload_file.assert_called_once()
         self.assertEqual(result["status"], "Success")
 
+    def test_put_object_passes_extra_args_on_every_path(self):
+        extra_args = {"ContentType": "application/json", "ContentEncoding": "gzip"}
+
+        s3_utils.put_object(self.client, self.bucket_name, self.object_name, io.BytesIO(b"data"), extra_args)
+        self.client.put_object.assert_called_once_with(
+            Bucket=self.bucket_name, Key=self.object_name, Body=b"data", **extra_args
+        )
+
+        with patch.object(s3_utils, "SINGLE_PUT_MAX_BYTES", 4):
+            s3_utils.put_object(self.client, self.bucket_name, self.object_name, io.BytesIO(b"data"), extra_args)
+        self.assertEqual(self.client.upload_fileobj.call_args.kwargs["ExtraArgs"], extra_args)
+
+        s3_utils.put_object(self.client, self.bucket_name, self.object_name, "dummy.txt", extra_args)
+        self.assertEqual(self.client.upload_file.call_args.kwargs["ExtraArgs"], extra_args)
+
     def test_put_object_with_invalid_type(self):
         result = s3_utils.put_object(self.client, self.bucket_name, self.object_name, 123)
         self.assertEqual(result["status"], "Failed")
         self.assertIn("must be either", result["error"])
 
     def test_put_object_with_client_error(self):
-        self.client.upload_fileobj.side_effect = ClientError(
+        self.client.put_object.side_effect = ClientError(
             {"Error": {"Code": "500", "Message": "Failed"}}, "upload"
         )
         buf = io.BytesIO(b"data")
@@ -53,6 +89,47 @@ class TestReadWriteS3(unittest.TestCase):
         buf = s3_utils.get_object(self.client, self.bucket_name, self.object_name)
         self.assertIsNone(buf)
 
+    def test_read_large_object_parallel_assembles_ranges(self):
+        payload = bytes(range(256)) * 40
+        self.client.head_object.return_value = {"ContentLength": len(payload), "ETag": '"v1"'}
+
+        def get_object(Bucket, Key, Range=None, IfMatch=None):
+            start, end = map(int, Range.removeprefix("bytes=").split("-"))
+            return {"Body": io.BytesIO(payload[start:end + 1])}
+
+        self.client.get_object.side_effect = get_object
+        result = s3_utils.read_large_object_parallel(
+            self.client, self.bucket_name, self.object_name, part_size=1000, max_workers=4
+        )
+
+        self.assertEqual(bytes(result), payload)
+        self.assertEqual(self.client.get_object.call_count, 11)
+        self.assertTrue(all(c.kwargs["IfMatch"] == '"v1"' for c in self.client.get_object.call_args_list))
+
+    def test_read_large_object_parallel_bypasses_head_cache(self):
+        self.client.head_object.return_value = {"ContentLength": 10, "ETag": '"v1"'}
+        s3_utils.object_exists(self.client, self.bucket_name, self.object_name)
+        self.client.head_object.return_value = {"ContentLength": 3000, "ETag": '"v2"'}
+        self.client.get_object.side_effect = lambda **kwargs: {"Body": io.BytesIO(b"x" * 1000)}
+
+        result = s3_utils.read_large_object_parallel(self.client, self.bucket_name, self.object_name, part_size=1000)
+
+        self.assertEqual(len(result), 3000)
+        self.assertEqual(self.client.head_object.call_count, 2)
+
+    def test_read_large_object_parallel_short_read_returns_none(self):
+        self.client.head_object.return_value = {"ContentLength": 3000, "ETag": '"v1"'}
+        self.client.get_object.side_effect = lambda **kwargs: {"Body": io.BytesIO(b"x" * 10)}
+
+        self.assertIsNone(
+            s3_utils.read_large_object_parallel(self.client, self.bucket_name, self.object_name, part_size=1000)
+        )
+
+    def test_read_large_object_parallel_missing_object(self):
+        self.client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "head_object")
+        self.assertIsNone(s3_utils.read_large_object_parallel(self.client, self.bucket_name, self.object_name))
+        self.client.get_object.assert_not_called()
+
     # === copy_object_between_buckets ===
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_copy_object_between_buckets_success(self, mock_connector):
@@ -60,16 +137,58 @@ class TestReadWriteS3(unittest.TestCase):
         mock_connector.return_value.client = mock_client
         result = s3_utils.copy_object_between_buckets("src-bucket", "src-key", "dest-bucket", "dest-key")
         self.assertEqual(result["status"], "Success")
-        mock_client.copy_object.assert_called_once()
+        mock_client.copy.assert_called_once()
+        self.assertIs(mock_client.copy.call_args.kwargs["Config"], s3_utils.aws_connection.S3_COPY_TRANSFER_CONFIG)
 
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_copy_object_between_buckets_fail(self, mock_connector):
         mock_client = MagicMock()
-        mock_client.copy_object.side_effect = ClientError({"Error": {}}, "copy_object")
+        mock_client.copy.side_effect = ClientError({"Error": {}}, "copy_object")
         mock_connector.return_value.client = mock_client
         result = s3_utils.copy_object_between_buckets("src", "key", "dest", "key2")
         self.assertEqual(result["status"], "Failed")
 
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_copy_objects_between_buckets_keeps_order(self, mock_connector):
+        def copy(**kwargs):
+            if kwargs["Key"] == "bad":
+                raise ClientError({"Error": {}}, "copy_object")
+
+        mock_client = MagicMock()
+        mock_client.copy.side_effect = copy
+        mock_connector.return_value.client = mock_client
+        pairs = [("src", f"key-{i}", "dest", "bad" if i == 2 else f"out-{i}") for i in range(5)]
+
+        results = s3_utils.copy_objects_between_buckets(pairs, max_workers=4)
+
+        self.assertEqual([r["destination"]["key"] for r in results], [p[3] for p in pairs])
+        self.assertEqual([r["status"] for r in results].count("Failed"), 1)
+        self.assertEqual(results[2]["status"], "Failed")
+        mock_connector.assert_called_once_with(bucket_name="src")
+
+    # === select_latest_rerun ===
+    def test_select_latest_rerun_prefers_highest_attempt(self):
+        keys = [
+            "out/DN001.json",
+            "out/DN001_rerun_2.json",
+            "out/DN001_rerun_10.json",
+            "out/DN001_rerun_x.json",
+            "out/DN002_rerun_99.json",
+        ]
+        self.assertEqual(s3_utils.select_latest_rerun(keys, "DN001"), "out/DN001_rerun_10.json")
+        self.assertEqual(s3_utils.select_latest_rerun(keys[:1], "DN001"), "out/DN001.json")
+        self.assertIsNone(s3_utils.select_latest_rerun(keys, "DN003"))
+
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_get_connector_builds_once_under_concurrency(self, mock_connector):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            connectors = list(pool.map(lambda _: s3_utils.get_connector("shared"), range(32)))
+
+        self.assertTrue(all(c is connectors[0] for c in connectors))
+        mock_connector.assert_called_once_with(bucket_name="shared")
+
     # === object_exists ===
     def test_object_exists_true(self):
         self.client.head_object.return_value = {"ContentLength": 100}
@@ -84,6 +203,22 @@ class TestReadWriteS3(unittest.TestCase):
         self.assertFalse(exists)
         self.assertIsNone(meta)
 
+    def test_object_exists_caches_until_invalidated(self):
+        self.client.head_object.return_value = {"ContentLength": 100}
+        for _ in range(3):
+            self.assertTrue(s3_utils.object_exists(self.client, self.bucket_name, self.object_name)[0])
+        self.client.head_object.assert_called_once()
+
+        s3_utils.put_object(self.client, self.bucket_name, self.object_name, b"new")
+        s3_utils.object_exists(self.client, self.bucket_name, self.object_name)
+        self.assertEqual(self.client.head_object.call_count, 2)
+
+    def test_object_exists_does_not_cache_transient_errors(self):
+        self.client.head_object.side_effect = ClientError({"Error": {"Code": "500"}}, "head_object")
+        s3_utils.object_exists(self.client, self.bucket_name, self.object_name)
+        s3_utils.object_exists(self.client, self.bucket_name, self.object_name)
+        self.assertEqual(self.client.head_object.call_count, 2)
+
     # === any_json_in_s3_prefix ===
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_any_json_in_s3_prefix_found(self, mock_connector):
@@ -127,12 +262,30 @@ class TestReadWriteS3(unittest.TestCase):
             result = s3_utils.write_json_to_s3({"a": 1}, file_record, self.bucket_name)
             self.assertEqual(result["status"], "Failed")
 
+    def test_serialize_json_pydantic_and_numpy_fallback(self):
+        from typing import Any
+        import numpy as np
+        from pydantic import BaseModel
+
+        class Row(BaseModel):
+            name: str
+            qty: Any = None
+
+        class Wrapper(BaseModel):
+            output: Any = None
+
+        self.assertEqual(json.loads(s3_utils._serialize_json(Row(name="a", qty=1))), {"name": "a", "qty": 1})
+        self.assertEqual(
+            json.loads(s3_utils._serialize_json(Wrapper(output=Row(name="b", qty=np.int64(3))))),
+            {"name": "b", "qty": 3},
+        )
+        self.assertEqual(json.loads(s3_utils._serialize_json(Wrapper(output={"k": 1}))), {"k": 1})
+
     # === read_json_from_s3 ===
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
-    @patch("fastapi_celery.utils.read_n_write_s3.get_object")
+    @patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes")
     def test_read_json_from_s3_success(self, mock_get_object, mock_connector):
-        buffer = io.BytesIO(json.dumps({"a": 1}).encode())
-        mock_get_object.return_value = buffer
+        mock_get_object.return_value = json.dumps({"a": 1}).encode()
         mock_connector.return_value.client = self.client
         mock_connector.return_value.bucket_name = self.bucket_name
 
@@ -140,24 +293,101 @@ class TestReadWriteS3(unittest.TestCase):
         self.assertEqual(result, {"a": 1})
 
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
-    @patch("fastapi_celery.utils.read_n_write_s3.get_object", return_value=None)
+    @patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes", return_value=None)
     def test_read_json_from_s3_none(self, mock_get_object, mock_connector):
         mock_connector.return_value.client = self.client
         mock_connector.return_value.bucket_name = self.bucket_name
         result = s3_utils.read_json_from_s3(self.bucket_name, self.object_name)
         self.assertIsNone(result)
 
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_write_then_read_json_roundtrip_gzip(self, mock_connector):
+        mock_connector.return_value.client = self.client
+        mock_connector.return_value.bucket_name = self.bucket_name
+
+        result = s3_utils.write_json_to_s3({"name": "café", "qty": 2}, self.bucket_name, self.object_name)
+        self.assertEqual(result["status"], "Success")
+
+        kwargs = self.client.put_object.call_args.kwargs
+        self.assertEqual(kwargs["ContentEncoding"], "gzip")
+        self.assertEqual(kwargs["ContentType"], "application/json")
+        self.assertEqual(json.loads(gzip.decompress(kwargs["Body"])), {"name": "café", "qty": 2})
+
+        with patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes", return_value=kwargs["Body"]):
+            self.assertEqual(
+                s3_utils.read_json_from_s3(self.bucket_name, self.object_name),
+                {"name": "café", "qty": 2},
+            )
+
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_read_jsons_from_s3_keeps_order(self, mock_connector):
+        mock_connector.return_value.client = self.client
+        bodies = {"a.json": b'{"n": 1}', "b.json": b'{"n": 2}'}
+
+        with patch(
+            "fastapi_celery.utils.read_n_write_s3.get_object_bytes",
+            side_effect=lambda client, bucket, key: bodies.get(key),
+        ):
+            result = s3_utils.read_jsons_from_s3(self.bucket_name, ["b.json", "missing.json", "a.json"])
+
+        self.assertEqual(result, [{"n": 2}, None, {"n": 1}])
+
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_write_jsons_to_s3_keeps_order(self, mock_connector):
+        mock_connector.return_value.client = self.client
+        mock_connector.return_value.bucket_name = self.bucket_name
+        records = [({"n": i}, f"out/{i}.json") for i in range(5)]
+
+        with patch(
+            "fastapi_celery.utils.read_n_write_s3.put_object",
+            return_value={"status": "Success", "error": None},
+        ) as mock_put:
+            result = s3_utils.write_jsons_to_s3(self.bucket_name, records)
+
+        self.assertEqual([r["s3_key_prefix"] for r in result], [key for _, key in records])
+        self.assertTrue(all(r["status"] == "Success" for r in result))
+        self.assertEqual(mock_put.call_count, 5)
+        self.assertEqual(s3_utils.write_jsons_to_s3(self.bucket_name, []), [])
+
     # === list_objects_with_prefix ===
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_list_objects_with_prefix_success(self, mock_connector):
         paginator = MagicMock()
-        paginator.paginate.return_value = [{"Contents": [{"Key": "a.json"}, {"Key": "b.json"}]}]
+        paginator.paginate.return_value.search.return_value = iter(["a.json", "b.json"])
         mock_connector.return_value.client.get_paginator.return_value = paginator
 
         result = s3_utils.list_objects_with_prefix("bucket", "prefix")
         self.assertEqual(result, ["a.json", "b.json"])
+        paginator.paginate.return_value.search.assert_called_once_with("Contents[].Key")
+
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_iter_objects_with_prefix_skips_empty_pages(self, mock_connector):
+        client = boto3.client("s3", region_name="us-east-1", aws_access_key_id="x", aws_secret_access_key="x")
+        stubber = Stubber(client)
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "p/a.json"}], "IsTruncated": True, "NextContinuationToken": "t"},
+        )
+        stubber.add_response("list_objects_v2", {"IsTruncated": False})
+        mock_connector.return_value.client = client
+
+        with stubber:
+            self.assertEqual(list(s3_utils.iter_objects_with_prefix("bucket", "p/")), ["p/a.json"])
 
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector", side_effect=Exception("init fail"))
     def test_list_objects_with_prefix_fail(self, mock_connector):
         result = s3_utils.list_objects_with_prefix("bucket", "prefix")
-        self.assertEqual(result, [])
\ No newline at end of file
+        self.assertEqual(result, [])
+
+    # === list_common_prefixes ===
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_list_common_prefixes_success(self, mock_connector):
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {"CommonPrefixes": [{"Prefix": "versioning/a/001/"}, {"Prefix": "versioning/a/002/"}]}
+        ]
+        mock_connector.return_value.client.get_paginator.return_value = paginator
+
+        result = s3_utils.list_common_prefixes("bucket", "versioning/a/")
+        self.assertEqual(result, ["versioning/a/001/", "versioning/a/002/"])
+        paginator.paginate.assert_called_once_with(Bucket="bucket", Prefix="versioning/a/", Delimiter="/")
\ No newline at end of file
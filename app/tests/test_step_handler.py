@@ -1,7 +1,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import BaseModel
-from fastapi_celery.models.class_models import StepOutput
+from fastapi_celery.models.class_models import FileRecord, StepOutput
 from fastapi_celery.celery_worker.step_handler import (
     build_s3_key_prefix,
     execute_step,
@@ -102,7 +102,7 @@ def test_extract_and_wrapper():
 # === build_s3_key_prefix ===
 def test_build_s3_key_prefix(monkeypatch):
     processor = MagicMock()
-    processor.file_record = {"file_name": "file.xlsx"}
+    processor.file_record = FileRecord(file_name="file.xlsx")
     processor.tracking_model = MagicMock()
     context_data = MagicMock()
     step = MagicMock()
@@ -119,7 +119,7 @@ def test_build_s3_key_prefix(monkeypatch):
 
 def test_build_s3_key_prefix_non_master_data():
     processor = MagicMock()
-    processor.file_record = {"file_name": "file.xlsx"}
+    processor.file_record = FileRecord(file_name="file.xlsx")
     processor.tracking_model = MagicMock()
     context_data = MagicMock()
     step = MagicMock()
@@ -154,7 +154,7 @@ async def test_execute_step_basic(mock_be_connector, mock_get_context_api):
     from fastapi_celery.celery_worker import step_handler
 
     file_processor = MagicMock()
-    file_processor.file_record = {"file_name": "dummy.xlsx", "file_extension": ".xlsx"}
+    file_processor.file_record = FileRecord(file_name="dummy.xlsx", file_extension=".xlsx")
     file_processor.workflow_step_ids = {}
     file_processor.tracking_model = MagicMock()
 
@@ -207,7 +207,7 @@ async def test_execute_step_skip_if_s3_exists():
     from fastapi_celery.models.class_models import StepOutput, StatusEnum
 
     file_processor = MagicMock()
-    file_processor.file_record = {"file_name": "dummy.xlsx", "file_extension": ".xlsx"}
+    file_processor.file_record = FileRecord(file_name="dummy.xlsx", file_extension=".xlsx")
     file_processor.tracking_model = MagicMock()
     file_processor.workflow_step_ids = {"STEP1": "step_1"}
     file_processor.check_step_result_exists_in_s3 = MagicMock(
@@ -241,7 +241,7 @@ async def test_execute_step_with_extract_to():
     from fastapi_celery.models.class_models import StepOutput, StatusEnum
 
     file_processor = MagicMock()
-    file_processor.file_record = {"file_name": "dummy.xlsx", "file_extension": ".xlsx"}
+    file_processor.file_record = FileRecord(file_name="dummy.xlsx", file_extension=".xlsx")
     file_processor.tracking_model = MagicMock()
     file_processor.workflow_step_ids = {}
     step = MagicMock()
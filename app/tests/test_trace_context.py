@@ -0,0 +1,48 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fastapi_celery.models.tracking_models import TrackingModel
+from fastapi_celery.utils import file_extraction
+
+# Use the same module instance as file_extraction (imported as `utils.trace_context`)
+trace_context = file_extraction.trace_context
+
+
+def test_ttl_cache_expires_and_evicts_oldest():
+    cache = trace_context.TTLCache(maxsize=2, ttl=10)
+
+    with patch.object(trace_context.time, "monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    with patch.object(trace_context.time, "monotonic", return_value=111.0):
+        assert cache.get("c") is None
+    assert len(cache) == 1
+
+
+def test_get_file_processor_is_reused_within_a_trace_only():
+    tracking_model = TrackingModel(request_id="req-001", file_path="folder/file.txt")
+    factory = MagicMock(side_effect=lambda **_: SimpleNamespace(_object_buffer=io.BytesIO(b"content")))
+
+    with patch.object(file_extraction, "FileExtensionProcessor", factory):
+        # Outside a trace every call builds a new processor
+        outside = file_extraction.get_file_processor(tracking_model)
+        assert file_extraction.get_file_processor(tracking_model) is not outside
+
+        token = trace_context.bind_trace_id("trace-1")
+        try:
+            first = file_extraction.get_file_processor(tracking_model)
+            first._object_buffer.read()
+            # Reused even if the model gained workflow fields, and rewound for the next reader
+            tracking_model.project_name = "DKSH_TW"
+            assert file_extraction.get_file_processor(tracking_model) is first
+            assert first._object_buffer.tell() == 0
+        finally:
+            trace_context.clear_trace("trace-1")
+            trace_context.reset_trace_id(token)
+
+    assert factory.call_count == 3
@@ -0,0 +1,47 @@
+import pytest
+
+from fastapi_celery.models.class_models import FilePathRequest
+from fastapi_celery.models.tracking_models import TrackingModel
+
+
+def test_from_data_request_matches_validated_construction():
+    request = FilePathRequest(
+        file_path="folder/file.xlsx",
+        project="DKSH_TW",
+        source="SFTP",
+        celery_id="req-001",
+        rerun_attempt=2,
+    )
+
+    constructed = TrackingModel.from_data_request(request)
+    validated = TrackingModel(
+        request_id="req-001",
+        file_path="folder/file.xlsx",
+        project_name="DKSH_TW",
+        source_name="SFTP",
+        rerun_attempt=2,
+    )
+
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.workflow_id is None
+
+
+@pytest.mark.parametrize("celery_id", [None, ""])
+def test_from_data_request_requires_celery_id(celery_id):
+    request = FilePathRequest(file_path="folder/file.xlsx", project="DKSH_TW", source="SFTP", celery_id=celery_id)
+
+    with pytest.raises(ValueError, match="celery_id"):
+        TrackingModel.from_data_request(request)
+
+
+def test_to_log_dict_is_memoized_and_reset_on_update():
+    tracking_model = TrackingModel(request_id="req-001", file_path="folder/file.xlsx")
+
+    log_dict = tracking_model.to_log_dict()
+    assert tracking_model.to_log_dict() is log_dict
+    assert log_dict["file_path"] == "folder/file.xlsx"
+
+    tracking_model.document_type = "ORDER"
+    assert tracking_model.to_log_dict() is not log_dict
+    assert tracking_model.to_log_dict()["document_type"] == "ORDER"
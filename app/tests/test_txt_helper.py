@@ -19,45 +19,49 @@ def dummy_tracking_model(tmp_path):
     )
 
 
-# ==== Test extract_text() ====
+# ==== Test iter_lines() ====
 
-def test_extract_text_s3_mode(monkeypatch, dummy_tracking_model):
-    """Should extract text from S3 source using object_buffer"""
+def test_iter_lines_s3_mode(monkeypatch, dummy_tracking_model):
+    """Should stream lines from S3 source using object_buffer"""
     mock_processor = MagicMock()
-    mock_processor.source = "s3"
-    mock_processor._get_file_capacity.return_value = "2 KB"
-    mock_processor._get_document_type.return_value = "order"
-    mock_processor.object_buffer = io.BytesIO(b"hello\nworld")
+    mock_processor.source_type = "s3"
+    mock_processor.file_size = "2 KB"
+    mock_processor.document_type = "order"
+    mock_processor.object_buffer = io.BytesIO(b"hello\r\nworld")
 
-    monkeypatch.setattr("utils.ext_extraction.FileExtensionProcessor", lambda **_: mock_processor)
+    monkeypatch.setattr("utils.file_extraction.FileExtensionProcessor", lambda **_: mock_processor)
 
     helper = TxtHelper(dummy_tracking_model, source_type=SourceType.SFTP)
-    result = helper.extract_text()
+    result = list(helper.iter_lines())
 
-    assert result == "hello\nworld"
+    assert result == ["hello", "world"]
     assert helper.capacity == "2 KB"
     assert helper.document_type == "order"
-    mock_processor._get_file_capacity.assert_called_once()
-    mock_processor._get_document_type.assert_called_once()
+    assert not mock_processor.object_buffer.closed
+    # Metadata is read from the prepared processor, not recomputed
+    mock_processor._get_file_capacity.assert_not_called()
+    mock_processor._get_document_type.assert_not_called()
 
 
-def test_extract_text_local_mode(monkeypatch, tmp_path, dummy_tracking_model):
-    """Should extract text from local file correctly"""
+def test_iter_lines_local_mode(monkeypatch, tmp_path, dummy_tracking_model):
+    """Should stream lines from local file correctly"""
     file_path = tmp_path / "local.txt"
-    file_path.write_text("local mode test", encoding="utf-8")
+    file_path.write_text("local mode test\nsecond line\n", encoding="utf-8")
 
     mock_processor = MagicMock()
-    mock_processor.source = "local"
+    mock_processor.source_type = SourceType.LOCAL
     mock_processor.file_path = str(file_path)
-    mock_processor._get_file_capacity.return_value = "1 KB"
-    mock_processor._get_document_type.return_value = "master_data"
+    # Local files must be read from disk, never through the S3 buffer
+    mock_processor.object_buffer.seek.side_effect = AssertionError("S3 buffer used for local file")
+    mock_processor.file_size = "1 KB"
+    mock_processor.document_type = "master_data"
 
-    monkeypatch.setattr("utils.ext_extraction.FileExtensionProcessor", lambda **_: mock_processor)
+    monkeypatch.setattr("utils.file_extraction.FileExtensionProcessor", lambda **_: mock_processor)
 
     helper = TxtHelper(dummy_tracking_model, source_type=SourceType.LOCAL)
-    result = helper.extract_text()
+    result = list(helper.iter_lines())
 
-    assert result == "local mode test"
+    assert result == ["local mode test", "second line"]
     assert helper.capacity == "1 KB"
     assert helper.document_type == "master_data"
 
@@ -74,8 +78,9 @@ def test_parse_file_to_json_parses_correctly(monkeypatch, dummy_tracking_model):
     helper.capacity = "3 KB"
     helper.document_type = "order"
 
-    monkeypatch.setattr(helper, "extract_text", lambda: mock_text)
-    mock_parse_func = MagicMock(return_value=mock_items)
+    monkeypatch.setattr(TxtHelper, "iter_lines", lambda self: iter(mock_text.splitlines()))
+    received = []
+    mock_parse_func = MagicMock(side_effect=lambda lines: received.extend(lines) or mock_items)
 
     result = helper.parse_file_to_json(mock_parse_func)
 
@@ -85,7 +90,8 @@ def test_parse_file_to_json_parses_correctly(monkeypatch, dummy_tracking_model):
     assert result.items == mock_items
     assert result.capacity == "3 KB"
     assert result.step_status == StatusEnum.SUCCESS
-    mock_parse_func.assert_called_once_with(["a", "b", "c"])
+    mock_parse_func.assert_called_once()
+    assert received == ["a", "b", "c"]
 
 
 def test_parse_file_to_json_handles_empty(monkeypatch, dummy_tracking_model):
@@ -94,7 +100,7 @@ def test_parse_file_to_json_handles_empty(monkeypatch, dummy_tracking_model):
     helper.capacity = "0 KB"
     helper.document_type = "order"
 
-    monkeypatch.setattr(helper, "extract_text", lambda: "")
+    monkeypatch.setattr(TxtHelper, "iter_lines", lambda self: iter(()))
     mock_parse_func = MagicMock(return_value=[])
 
     result = helper.parse_file_to_json(mock_parse_func)
@@ -105,17 +111,17 @@ def test_parse_file_to_json_handles_empty(monkeypatch, dummy_tracking_model):
     assert result.capacity == "0 KB"
 
 
-def test_extract_text_error_handling(monkeypatch, dummy_tracking_model):
+def test_iter_lines_error_handling(monkeypatch, dummy_tracking_model):
     """Should raise exception when file reading fails"""
     mock_processor = MagicMock()
-    mock_processor.source = "local"
+    mock_processor.source_type = SourceType.LOCAL
     mock_processor.file_path = "nonexistent.txt"
-    mock_processor._get_file_capacity.return_value = "1 KB"
-    mock_processor._get_document_type.return_value = "order"
+    mock_processor.file_size = "1 KB"
+    mock_processor.document_type = "order"
 
-    monkeypatch.setattr("utils.ext_extraction.FileExtensionProcessor", lambda **_: mock_processor)
+    monkeypatch.setattr("utils.file_extraction.FileExtensionProcessor", lambda **_: mock_processor)
     helper = TxtHelper(dummy_tracking_model)
 
     with patch.object(builtins, "open", side_effect=FileNotFoundError):
         with pytest.raises(FileNotFoundError):
-            helper.extract_text()
+            list(helper.iter_lines())
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch
 from types import SimpleNamespace
 from fastapi_celery.processors.workflow_processors import write_raw_to_s3
-from fastapi_celery.models.class_models import DocumentType, StepOutput, StatusEnum
+from fastapi_celery.models.class_models import DocumentType, FileRecord, StepOutput, StatusEnum
 
 
 # ============================================================
@@ -92,3 +92,35 @@ def test_write_raw_to_s3_exception(mock_get_dest, mock_get_src, mock_copy):
     assert result.step_status.value == StatusEnum.FAILED.value
     assert result.output is None
     assert "Exception in write_raw_to_s3" in result.step_failure_message[0]
+
+
+# ============================================================
+# TEST: write_raw_to_s3 copies into the current and next version keys
+# ============================================================
+
+@patch("fastapi_celery.processors.workflow_processors.write_raw_to_s3.read_n_write_s3.list_common_prefixes")
+@patch("fastapi_celery.processors.workflow_processors.write_raw_to_s3.read_n_write_s3.copy_object_between_buckets")
+def test_write_raw_to_s3_copies_current_and_next_version(mock_copy, mock_list):
+    mock_copy.return_value = {"status": "Success"}
+    mock_list.return_value = ["versioning/sample/001/", "versioning/sample/002/"]
+
+    fake_self = SimpleNamespace(
+        tracking_model=SimpleNamespace(
+            request_id="req-1", rerun_attempt=None, sap_masterdata=True, to_log_dict=lambda: {}
+        ),
+        file_record=FileRecord(
+            file_path="raw/sample.xlsx",
+            file_name="sample.xlsx",
+            file_name_wo_ext="sample",
+            raw_bucket_name="raw-bucket",
+            target_bucket_name="target-bucket",
+        ),
+    )
+
+    result = write_raw_to_s3.write_raw_to_s3(fake_self)
+
+    assert result.step_status == StatusEnum.SUCCESS
+    assert result.output == {"status": "Success"}
+    dest_keys = sorted(call.kwargs["dest_key"] for call in mock_copy.call_args_list)
+    assert dest_keys == ["master_data/sample/sample.xlsx", "versioning/sample/003/sample.xlsx"]
+    assert all(call.kwargs["source_bucket"] == "raw-bucket" for call in mock_copy.call_args_list)
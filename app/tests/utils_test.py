@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import os
 import logging
+import queue
 import traceback
 from fastapi_celery.utils import log_helper
 from fastapi_celery.connections import aws_connection
@@ -325,6 +326,51 @@ def test_load_s3_file_not_found(
         FileExtensionProcessor(tracking_model=tracking_model, source_type=SourceType.SFTP)
 
 
+@patch("fastapi_celery.utils.file_extraction.get_bucket_name", return_value=BUCKET_NAME)
+@patch("fastapi_celery.utils.file_extraction.read_n_write_s3.get_object")
+@patch("fastapi_celery.utils.file_extraction.read_n_write_s3.aws_connection.S3Connector")
+def test_s3_body_is_downloaded_on_first_access(
+    mock_s3_connector_cls, mock_get_object, mock_get_bucket_name
+) -> None:
+    """Metadata comes from a single HEAD request; the body is only fetched when read."""
+    mock_client = MagicMock()
+    mock_client.head_object.return_value = {"ContentLength": 2048}
+    mock_s3_connector_cls.return_value.client = mock_client
+    mock_get_object.return_value = io.BytesIO(b"content")
+
+    tracking_model = TrackingModel(request_id="test", file_path="path/to/file.txt")
+    processor = FileExtensionProcessor(tracking_model=tracking_model, source_type=SourceType.SFTP)
+
+    assert processor.file_size == "2.00 KB"
+    mock_client.head_object.assert_called_once()
+    mock_get_object.assert_not_called()
+
+    assert processor.object_buffer.read() == b"content"
+    assert processor.object_buffer is processor.object_buffer
+    mock_get_object.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "file_path, expected",
+    [
+        ("MASTER_DATA/customers.csv", DocumentType.MASTER_DATA),
+        ("project/Master_Data/customers.csv", DocumentType.MASTER_DATA),
+        ("project/master_data_archive/customers.csv", DocumentType.ORDER),
+        ("project/orders/po.pdf", DocumentType.ORDER),
+    ],
+)
+def test_get_document_type_matches_master_data_folder(file_path, expected) -> None:
+    """Only a whole `master_data` folder (any case) marks the file as master data."""
+    processor = FileExtensionProcessor.__new__(FileExtensionProcessor)
+    processor.file_path = file_path
+    processor._path = Path(file_path)
+    processor.document_type = None
+
+    assert processor._get_document_type() == expected
+
+    assert processor.document_type == expected
+
+
 # === Log helper ===
 
 
@@ -404,6 +450,92 @@ def test_logger_adapter_validation_and_process():
     assert isinstance(new_kwargs["extra"], dict)
 
 
+def test_rate_limit_filter_drops_repeated_info_only():
+    rate_limit = log_helper.RateLimitFilter(window=60)
+
+    def make_record(level):
+        record = logging.LogRecord("test", level, __file__, 1, "same message", None, None)
+        record.service = "file-storage"
+        record.log_type = "task"
+        return record
+
+    assert rate_limit.filter(make_record(logging.INFO)) is True
+    assert rate_limit.filter(make_record(logging.INFO)) is False
+    # Errors are never rate-limited
+    assert rate_limit.filter(make_record(logging.ERROR)) is True
+    assert rate_limit.filter(make_record(logging.ERROR)) is True
+
+
+def test_rate_limit_filter_keys_on_formatted_message():
+    rate_limit = log_helper.RateLimitFilter(window=60)
+
+    def make_record(file_name):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, "Processing %s", (file_name,), None)
+
+    assert rate_limit.filter(make_record("a.pdf")) is True
+    assert rate_limit.filter(make_record("b.pdf")) is True
+    assert rate_limit.filter(make_record("a.pdf")) is False
+
+
+def test_rate_limit_filter_keeps_same_message_from_other_requests():
+    rate_limit = log_helper.RateLimitFilter(window=60)
+
+    def make_record(request_id):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "step successfully executed!", None, None)
+        record.data = {"request_id": request_id}
+        return record
+
+    assert rate_limit.filter(make_record("req-1")) is True
+    assert rate_limit.filter(make_record("req-2")) is True
+    assert rate_limit.filter(make_record("req-1")) is False
+
+
+def test_stop_queue_listener_flushes_handlers(monkeypatch):
+    listener = MagicMock()
+    listener.handlers = (MagicMock(),)
+    monkeypatch.setattr(log_helper, "_queue_listener", listener)
+
+    log_helper.stop_queue_listener()
+    log_helper.stop_queue_listener()
+
+    listener.stop.assert_called_once()
+    listener.handlers[0].flush.assert_called_once()
+    assert log_helper._queue_listener is None
+
+def test_queue_listener_is_rebuilt_in_forked_child(monkeypatch):
+    inherited_listener = MagicMock()
+    monkeypatch.setattr(log_helper, "_queue_listener", inherited_listener)
+    monkeypatch.setattr(log_helper, "_log_queue", queue.SimpleQueue())
+    monkeypatch.setattr(log_helper, "_build_sink_handlers", lambda: [])
+
+    log_helper._restart_queue_listener_in_child()
+    try:
+        assert log_helper._queue_listener is not inherited_listener
+        assert log_helper._queue_listener._thread.is_alive()
+    finally:
+        log_helper._queue_listener.stop()
+
+
+def test_batching_elk_handler_sends_one_bulk_request_per_batch():
+    handler = log_helper.BatchingElkHandler("http://elk:9200/", "test-index", batch_size=2, flush_interval=60)
+    handler._client = MagicMock()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.handle(logging.makeLogRecord({"msg": "first"}))
+    handler._client.post.assert_not_called()
+    handler.handle(logging.makeLogRecord({"msg": "second"}))
+
+    handler._client.post.assert_called_once()
+    args, kwargs = handler._client.post.call_args
+    assert args[0] == "http://elk:9200/_bulk"
+    assert kwargs["content"].decode().splitlines() == [
+        '{"index":{"_index":"test-index"}}',
+        "first",
+        '{"index":{"_index":"test-index"}}',
+        "second",
+    ]
+
+
 class TestAnyJsonInS3Prefix(unittest.TestCase):
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_any_json_in_s3_prefix_found(self, mock_s3_connector):
@@ -442,9 +574,22 @@ class TestAnyJsonInS3Prefix(unittest.TestCase):
         result = any_json_in_s3_prefix("my-bucket", "folder/")
         self.assertFalse(result)
 
+    @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
+    def test_any_json_in_s3_prefix_exact_key_uses_single_request(self, mock_s3_connector):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {"Contents": [{"Key": "folder/data.json"}]}
+        mock_s3_connector.return_value.client = mock_client
+
+        _s3_connectors.clear()
+        self.assertTrue(any_json_in_s3_prefix("my-bucket", "folder/data.json"))
+        mock_client.list_objects_v2.assert_called_once_with(
+            Bucket="my-bucket", Prefix="folder/data.json", MaxKeys=1
+        )
+        mock_client.get_paginator.assert_not_called()
+
 
 class TestReadJsonFromS3(unittest.TestCase):
-    @patch("fastapi_celery.utils.read_n_write_s3.get_object")
+    @patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes")
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_read_json_success(self, mock_s3_connector, mock_get_object):
         # Mock S3Connector client and bucket_name
@@ -453,15 +598,15 @@ class TestReadJsonFromS3(unittest.TestCase):
         mock_s3_connector.return_value.bucket_name = "my-bucket"
         _s3_connectors.clear()
 
-        # Prepare JSON content to return as BytesIO
+        # Prepare JSON content to return as raw bytes
         sample_data = {"key": "value"}
-        json_bytes = io.BytesIO(json.dumps(sample_data).encode("utf-8"))
+        json_bytes = json.dumps(sample_data).encode("utf-8")
         mock_get_object.return_value = json_bytes
 
         result = read_json_from_s3("my-bucket", "path/to/object.json")
         self.assertEqual(result, sample_data)
 
-    @patch("fastapi_celery.utils.read_n_write_s3.get_object")
+    @patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes")
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_read_json_object_not_found(self, mock_s3_connector, mock_get_object):
         mock_client = MagicMock()
@@ -475,7 +620,7 @@ class TestReadJsonFromS3(unittest.TestCase):
         result = read_json_from_s3("my-bucket", "missing.json")
         self.assertIsNone(result)
 
-    @patch("fastapi_celery.utils.read_n_write_s3.get_object")
+    @patch("fastapi_celery.utils.read_n_write_s3.get_object_bytes")
     @patch("fastapi_celery.utils.read_n_write_s3.aws_connection.S3Connector")
     def test_read_json_parse_error(self, mock_s3_connector, mock_get_object):
         mock_client = MagicMock()
@@ -484,7 +629,7 @@ class TestReadJsonFromS3(unittest.TestCase):
         _s3_connectors.clear()
 
         # Return invalid JSON content
-        invalid_json_bytes = io.BytesIO(b"{invalid json}")
+        invalid_json_bytes = b"{invalid json}"
         mock_get_object.return_value = invalid_json_bytes
 
         result = read_json_from_s3("my-bucket", "invalid.json")
@@ -495,11 +640,9 @@ class TestListObjectsWithPrefix(unittest.TestCase):
     def test_list_objects_with_prefix_success(self, mock_s3_connector):
         mock_client = MagicMock()
         mock_paginator = MagicMock()
-        mock_page_iterator = [
-            {"Contents": [{"Key": "folder/file1.txt"}, {"Key": "folder/file2.json"}]},
-            {"Contents": [{"Key": "folder/file3.csv"}]},
-        ]
-        mock_paginator.paginate.return_value = mock_page_iterator
+        mock_paginator.paginate.return_value.search.return_value = iter(
+            ["folder/file1.txt", "folder/file2.json", "folder/file3.csv"]
+        )
         mock_client.get_paginator.return_value = mock_paginator
         mock_s3_connector.return_value.client = mock_client
 